@@ -8,6 +8,14 @@ progressive disclosure of results.
 Inspired by the "working out loud" philosophy from Claude Code.
 """
 
+import sys
+from pathlib import Path
+
+# Make spoon_ai (in the repository root) importable, adding the path only once
+_root = str(Path(__file__).parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
 __version__ = "0.1.0"
 __author__ = "SpoonOS"
 __description__ = "A transparent CLI interface for AI agents"
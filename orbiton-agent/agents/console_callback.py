@@ -1,20 +1,33 @@
 """Console callback handler for capturing agent events and displaying in UI."""
 
+import io
+import json
+import re
 import time
 from typing import Any, Optional
-from datetime import datetime
-
-from rich.live import Live
-from rich.panel import Panel
-from rich.tree import Tree
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from spoon_ai.callbacks.base import BaseCallbackHandler
 from console.renderer import Renderer
-from console.theme import SPINNER_THINKING, SYMBOL_THINKING
+from console.theme import (
+    SYMBOL_THINKING,
+    SYMBOL_TOOL_ACTION,
+    SYMBOL_TOOL_RESULT,
+    SYMBOL_ERROR,
+)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Matches tool input that looks like a JSON object, without copying the string
+_JSON_OBJECT_START = re.compile(r"\s*\{")
+
+# Streaming flush thresholds: write buffered tokens once this many characters
+# have accumulated or this many seconds have passed since the last write.
+_FLUSH_CHARS = 128
+_FLUSH_SECS = 0.03
 
 
 class ConsoleCallbackHandler(BaseCallbackHandler):
@@ -30,17 +43,28 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
         super().__init__()
         self.renderer = renderer
 
+        # Resolve theme styles once instead of on every print
+        self._thinking_style = renderer.console.get_style("thinking")
+        self._tool_action_style = renderer.console.get_style("tool.action")
+
+        # ANSI codes that open/close the thinking style, for raw token writes
+        self._thinking_ansi = self._render_ansi(self._thinking_style)
+
         # State tracking
         self.current_tool: Optional[str] = None
-        self.current_tree: Optional[Tree] = None
-        self.thinking_buffer: list[str] = []
+        self.thinking_buffer = io.StringIO()
         self.thinking_start_time: Optional[float] = None
         self.tool_start_time: Optional[float] = None
-        self.live_display: Optional[Live] = None
+
+        # Token streaming state (tokens are flushed in batches)
+        self._stream_buffer = io.StringIO()
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
 
         # Configuration
         self.show_thinking = True
         self.stream_tokens = True
+        self.measure_tool_time = True
 
     def on_llm_start(self, serialized: dict[str, Any], prompts: list[str], **kwargs: Any) -> None:
         """
@@ -51,8 +75,10 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
             prompts: Input prompts
             **kwargs: Additional arguments
         """
-        self.thinking_buffer = []
-        self.thinking_start_time = time.time()
+        self.thinking_buffer = io.StringIO()
+        self._reset_stream()
+        # Only read the clock when the duration will be displayed
+        self.thinking_start_time = time.monotonic() if self.show_thinking else None
 
         # Show status
         if self.show_thinking:
@@ -70,11 +96,17 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
             **kwargs: Additional arguments
         """
         # Accumulate thinking tokens
-        self.thinking_buffer.append(token)
+        self.thinking_buffer.write(token)
 
-        # Stream to console if enabled
+        # Stream to console in batches if enabled
         if self.stream_tokens and self.show_thinking:
-            self.renderer.console.print(token, end="", style="thinking")
+            self._stream_buffer.write(token)
+            self._pending_chars += len(token)
+            if (
+                self._pending_chars >= _FLUSH_CHARS
+                or time.monotonic() - self._last_flush >= _FLUSH_SECS
+            ):
+                self.flush_stream()
 
     def on_llm_end(self, response: Any, **kwargs: Any) -> None:
         """
@@ -84,15 +116,19 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
             response: LLM response
             **kwargs: Additional arguments
         """
-        if self.thinking_start_time:
-            duration = time.time() - self.thinking_start_time
+        # Write out any tokens still waiting in the stream buffer
+        if self.stream_tokens and self.show_thinking:
+            self.flush_stream()
+
+        if self.thinking_start_time is not None:
+            duration = time.monotonic() - self.thinking_start_time
 
-            if self.show_thinking and self.thinking_buffer:
+            thinking_text = self.thinking_buffer.getvalue()
+            if self.show_thinking and thinking_text:
                 # Clear the thinking line
                 self.renderer.console.print()
 
                 # Show thinking summary
-                thinking_text = "".join(self.thinking_buffer)
                 if thinking_text.strip():
                     self.renderer.render_thinking(
                         thinking_text,
@@ -105,7 +141,8 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
                 self.renderer.console.print(f" ({duration:.1f}s)")
 
             self.thinking_start_time = None
-            self.thinking_buffer = []
+            self.thinking_buffer = io.StringIO()
+            self._reset_stream()
 
     def on_llm_error(self, error: Exception, **kwargs: Any) -> None:
         """
@@ -116,7 +153,8 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
             **kwargs: Additional arguments
         """
         self.renderer.render_error(str(error), title="LLM Error")
-        self.thinking_buffer = []
+        self.thinking_buffer = io.StringIO()
+        self._reset_stream()
         self.thinking_start_time = None
 
     def on_tool_start(
@@ -136,29 +174,29 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
         # Extract tool name and arguments
         tool_name = serialized.get("name", "unknown_tool")
         self.current_tool = tool_name
-        self.tool_start_time = time.time()
-
-        # Parse arguments from input_str (simple approach)
-        try:
-            # Try to parse as dict or use as string
-            import json
-            if input_str.strip().startswith("{"):
-                args = json.loads(input_str)
-            else:
-                args = {"input": input_str}
-        except:
+        if self.measure_tool_time:
+            self.tool_start_time = time.monotonic()
+
+        # Parse arguments from input_str: JSON objects become dicts, dicts from
+        # tool wrappers are used as is, anything else is a single input value
+        args = input_str
+        if isinstance(input_str, str) and _JSON_OBJECT_START.match(input_str):
+            try:
+                args = _json_loads(input_str)
+            except ValueError:
+                pass
+        if not isinstance(args, dict):
             args = {"input": input_str}
 
         # Format arguments for display
         args_str = self._format_tool_args(args)
 
         # Display tool call in simple format: > ToolName('params')
-        from console.theme import SYMBOL_TOOL_ACTION
-        tool_call_text = f"[tool.action]{SYMBOL_TOOL_ACTION} {tool_name}({args_str})[/]"
-        self.renderer.console.print(f"\n{tool_call_text}")
-
-        # Store the current tree as None (we'll just print directly)
-        self.current_tree = None
+        self.renderer.console.print(
+            f"\n{SYMBOL_TOOL_ACTION} {tool_name}({args_str})",
+            style=self._tool_action_style,
+            markup=False,
+        )
 
     def on_tool_end(self, output: str, **kwargs: Any) -> None:
         """
@@ -169,17 +207,17 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
             **kwargs: Additional arguments
         """
         # Display tool result in simple format: ↳ ToolResponse
-        from console.theme import SYMBOL_TOOL_RESULT
-
         # Truncate very long outputs for readability
         display_output = output[:300] + "..." if len(output) > 300 else output
 
-        result_text = f"[tool.result]{SYMBOL_TOOL_RESULT} {display_output}[/]"
-        self.renderer.console.print(result_text)
+        # Print without markup so Rich doesn't parse (or choke on) tool output
+        self.renderer.console.print(
+            SYMBOL_TOOL_RESULT, display_output, style="tool.result", markup=False
+        )
 
         # Calculate execution time
-        if self.tool_start_time:
-            duration = time.time() - self.tool_start_time
+        if self.tool_start_time is not None:
+            duration = time.monotonic() - self.tool_start_time
             if duration > 0.1:  # Only show if meaningful
                 self.renderer.console.print(
                     f"[dim]  Completed in {duration:.2f}s[/]"
@@ -189,7 +227,6 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
 
         # Reset state
         self.current_tool = None
-        self.current_tree = None
         self.tool_start_time = None
 
     def on_tool_error(self, error: Exception, **kwargs: Any) -> None:
@@ -201,15 +238,12 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
             **kwargs: Additional arguments
         """
         # Display error in simple format
-        from console.theme import SYMBOL_ERROR
-
         error_msg = f"[error]{SYMBOL_ERROR} {str(error)}[/]"
         self.renderer.console.print(error_msg)
         self.renderer.console.print()  # Empty line for spacing
 
         # Reset state
         self.current_tool = None
-        self.current_tree = None
         self.tool_start_time = None
 
     def on_agent_action(self, action: Any, **kwargs: Any) -> None:
@@ -232,18 +266,14 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
             **kwargs: Additional arguments
         """
         # Extract final output
-        if hasattr(finish, 'return_values'):
-            output = finish.return_values.get('output', '')
-            if output:
-                self.renderer.render_agent_message(
-                    output,
-                    timestamp=datetime.now()
-                )
-        elif hasattr(finish, 'output'):
-            self.renderer.render_agent_message(
-                finish.output,
-                timestamp=datetime.now()
-            )
+        return_values = getattr(finish, 'return_values', None)
+        if return_values is not None:
+            output = return_values.get('output', '')
+        else:
+            output = getattr(finish, 'output', '')
+
+        if output:
+            self.renderer.render_agent_message(output)
 
     def on_chain_start(
         self,
@@ -296,6 +326,51 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
 
     # Helper methods
 
+    def flush_stream(self):
+        """Write any buffered, not yet displayed tokens to the console."""
+        chunk = self._stream_buffer.getvalue()
+        if chunk:
+            console = self.renderer.console
+            if self._thinking_ansi and console.is_terminal:
+                # Bypass Rich markup parsing and rendering for raw LLM text
+                ansi_open, ansi_close = self._thinking_ansi
+                console.file.write(ansi_open + chunk + ansi_close)
+                console.file.flush()
+            else:
+                console.print(
+                    chunk, end="", style=self._thinking_style, markup=False, highlight=False
+                )
+            self._stream_buffer.seek(0)
+            self._stream_buffer.truncate()
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
+    def _render_ansi(self, style) -> Optional[tuple[str, str]]:
+        """
+        Get the ANSI escape codes the console uses for a style.
+
+        Args:
+            style: Resolved Rich style
+
+        Returns:
+            (open, close) escape code pair, or None if the console emits no color
+        """
+        console = self.renderer.console
+        if not console.is_terminal:
+            return None
+
+        with console.capture() as capture:
+            console.print("\x00", style=style, end="", markup=False, highlight=False)
+        ansi_open, _, ansi_close = capture.get().partition("\x00")
+        return (ansi_open, ansi_close) if ansi_open else None
+
+    def _reset_stream(self):
+        """Reset token streaming state for a new LLM call."""
+        self._stream_buffer.seek(0)
+        self._stream_buffer.truncate()
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+
     def _format_tool_args(self, arguments: dict) -> str:
         """
         Format tool arguments for display.
@@ -309,20 +384,18 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
         if not arguments:
             return ""
 
-        formatted = []
-        for key, value in arguments.items():
+        def _format_value(value: Any) -> str:
+            is_str = isinstance(value, str)
+            value_str = value if is_str else str(value)
             # Truncate long values
-            value_str = str(value)
             if len(value_str) > 50:
                 value_str = value_str[:47] + "..."
-
             # Add quotes for strings
-            if isinstance(value, str):
-                value_str = f'"{value_str}"'
-
-            formatted.append(f"{key}={value_str}")
+            return '"%s"' % value_str if is_str else value_str
 
-        return ", ".join(formatted)
+        return ", ".join(
+            "%s=%s" % (key, _format_value(value)) for key, value in arguments.items()
+        )
 
     def set_show_thinking(self, show: bool):
         """Enable or disable thinking display."""
@@ -331,3 +404,7 @@ class ConsoleCallbackHandler(BaseCallbackHandler):
     def set_stream_tokens(self, stream: bool):
         """Enable or disable token streaming."""
         self.stream_tokens = stream
+
+    def set_measure_tool_time(self, measure: bool):
+        """Enable or disable tool execution timing."""
+        self.measure_tool_time = measure
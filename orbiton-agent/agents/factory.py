@@ -1,11 +1,13 @@
 """Agent factory for creating and managing AI agents."""
 
-import sys
+import asyncio
+import functools
+import logging
+import os
+import re
 from pathlib import Path
 from typing import Any, Optional
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from spoon_ai.agents.spoon_react import SpoonReactAI
 from spoon_ai.agents.spoon_react_mcp import SpoonReactMCP
 from spoon_ai.chat import ChatBot, Memory
@@ -13,6 +15,82 @@ from spoon_ai.callbacks.base import BaseCallbackHandler
 from spoon_ai.tools.mcp_tool import MCPTool
 from spoon_ai.tools.tool_manager import ToolManager
 
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+logger = logging.getLogger(__name__)
+
+# Horizontal rule used to frame debug log entries
+_HR = "=" * 80
+
+# Agent types accepted by AgentFactory.create_agent
+_VALID_AGENT_TYPES = frozenset({"react", "react-mcp"})
+
+# Static descriptions returned by AgentFactory.list_available_agents
+_AVAILABLE_AGENTS = (
+    {
+        "type": "react",
+        "name": "ReAct Agent",
+        "description": "Standard ReAct agent with reasoning and action capabilities",
+    },
+    {
+        "type": "react-mcp",
+        "name": "ReAct MCP Agent",
+        "description": "ReAct agent with Model Context Protocol support",
+    },
+)
+
+# Matches "${VAR}" or "${VAR:-default}" placeholders in MCP server env values
+_ENV_VAR_RE = re.compile(r"^\$\{([^}:]+)(?::-([^}]*))?\}$")
+
+# Environment defaults that keep MCP subprocesses quiet
+_MCP_ENV_DEFAULTS = {
+    "PYTHONWARNINGS": "ignore",
+    "PYTHONUNBUFFERED": "0",
+    # For Node.js based MCP tools
+    "NODE_ENV": "production",
+    "NPM_CONFIG_LOGLEVEL": "error",
+}
+
+# .env file in the orbiton-agent directory and the mtime it was last loaded at
+_ENV_PATH = Path(__file__).parent.parent / ".env"
+_env_mtime: Optional[float] = None
+
+
+def _ensure_env_loaded() -> None:
+    """Load the orbiton-agent .env file, re-parsing it only when it changed on disk."""
+    global _env_mtime
+
+    if load_dotenv is None:
+        return
+
+    try:
+        mtime = _ENV_PATH.stat().st_mtime
+    except OSError:
+        return
+
+    if mtime != _env_mtime:
+        load_dotenv(_ENV_PATH, override=True)
+        _env_mtime = mtime
+        _env_credentials.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _env_credentials() -> tuple[Optional[str], Optional[str]]:
+    """
+    Read LLM credentials from the environment.
+
+    Cached until _ensure_env_loaded() sees the .env file change.
+
+    Returns:
+        Tuple of (api_key, base_url)
+    """
+    environ = os.environ
+    api_key = environ.get("OPENAI_API_KEY") or environ.get("ANTHROPIC_API_KEY")
+    return api_key, environ.get("BASE_URL")
+
 
 class AgentFactory:
     """Factory for creating AI agents with proper configuration."""
@@ -28,10 +106,6 @@ class AgentFactory:
         Returns:
             List of MCPTool instances
         """
-        import os
-        import logging
-
-        logger = logging.getLogger(__name__)
         mcp_tools = []
 
         if not mcp_config.get("enabled", False):
@@ -48,32 +122,28 @@ class AgentFactory:
                 server_name = server.get("name", "unknown")
                 server_config = server.get("config", {})
 
-                # Replace environment variables in config
-                if "env" in server_config:
-                    env_vars = {}
-                    for key, value in server_config["env"].items():
-                        # Replace ${VAR} with actual environment variable
-                        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                            env_var = value[2:-1]
-                            env_value = os.getenv(env_var)
-                            if env_value:
-                                env_vars[key] = env_value
-                            else:
-                                logger.warning(f"Environment variable {env_var} not found for MCP server {server_name}")
-                        else:
-                            env_vars[key] = value
-                    server_config["env"] = env_vars
-                else:
-                    env_vars = {}
-                    server_config["env"] = env_vars
-
-                # Suppress verbose output from MCP subprocesses
-                # Add environment variables to reduce logging noise
-                server_config["env"]["PYTHONWARNINGS"] = "ignore"
-                server_config["env"]["PYTHONUNBUFFERED"] = "0"
-                # For Node.js based MCP tools
-                server_config["env"]["NODE_ENV"] = "production"
-                server_config["env"]["NPM_CONFIG_LOGLEVEL"] = "error"
+                # Replace ${VAR} / ${VAR:-default} with environment variables
+                env_vars = {}
+                for key, value in server_config.get("env", {}).items():
+                    match = _ENV_VAR_RE.match(value) if isinstance(value, str) else None
+                    if match is None:
+                        env_vars[key] = value
+                        continue
+
+                    env_var, default = match.groups()
+                    env_value = os.environ.get(env_var) or default
+                    if env_value:
+                        env_vars[key] = env_value
+                    else:
+                        logger.warning(
+                            "Environment variable %s not found for MCP server %s",
+                            env_var,
+                            server_name,
+                        )
+
+                # Suppress verbose output from MCP subprocesses unless the
+                # server config sets these variables explicitly
+                server_config["env"] = {**_MCP_ENV_DEFAULTS, **env_vars}
 
                 # Create MCPTool instance
                 mcp_tool = MCPTool(
@@ -110,9 +180,10 @@ class AgentFactory:
             ValueError: If agent type is unknown or configuration is invalid
         """
         # Validate agent type
-        valid_types = ["react", "react-mcp"]
-        if agent_type not in valid_types:
-            raise ValueError(f"Unknown agent type: {agent_type}. Valid types: {valid_types}")
+        if agent_type not in _VALID_AGENT_TYPES:
+            raise ValueError(
+                f"Unknown agent type: {agent_type}. Valid types: {sorted(_VALID_AGENT_TYPES)}"
+            )
 
         # Extract configuration
         llm_config = config.get("llm", {})
@@ -120,17 +191,12 @@ class AgentFactory:
 
         # Initialize ChatBot (which uses LLM Manager internally)
         try:
-            import os
-            from dotenv import load_dotenv
+            # Load .env from orbiton-agent directory (re-read only if modified)
+            _ensure_env_loaded()
 
-            # Force reload .env from orbiton-agent directory
-            env_path = Path(__file__).parent.parent / ".env"
-            if env_path.exists():
-                load_dotenv(env_path, override=True)
-
-            # Get base_url from environment if available
-            base_url = os.getenv("BASE_URL") or llm_config.get("base_url")
-            api_key = os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
+            # Get api_key and base_url from environment if available
+            api_key, base_url = _env_credentials()
+            base_url = base_url or llm_config.get("base_url")
 
             # Prepare callbacks list
             callbacks_list = [callback_handler] if callback_handler else []
@@ -193,18 +259,7 @@ class AgentFactory:
         Returns:
             List of agent information dictionaries
         """
-        return [
-            {
-                "type": "react",
-                "name": "ReAct Agent",
-                "description": "Standard ReAct agent with reasoning and action capabilities",
-            },
-            {
-                "type": "react-mcp",
-                "name": "ReAct MCP Agent",
-                "description": "ReAct agent with Model Context Protocol support",
-            },
-        ]
+        return [dict(agent) for agent in _AVAILABLE_AGENTS]
 
     @staticmethod
     def get_agent_info(agent_type: str) -> Optional[dict[str, Any]]:
@@ -217,10 +272,9 @@ class AgentFactory:
         Returns:
             Agent information or None if not found
         """
-        agents = AgentFactory.list_available_agents()
-        for agent in agents:
+        for agent in _AVAILABLE_AGENTS:
             if agent["type"] == agent_type:
-                return agent
+                return dict(agent)
         return None
 
 
@@ -235,21 +289,28 @@ class AgentSession:
             agent: Agent instance
             config: Configuration dictionary
         """
-        import asyncio
-        import logging
-
         self.agent = agent
         self.config = config
+
+        # The agent never changes for a session, so resolve its type once
+        if isinstance(agent, SpoonReactMCP):
+            self._agent_type = "react-mcp"
+        elif isinstance(agent, SpoonReactAI):
+            self._agent_type = "react"
+        else:
+            self._agent_type = "unknown"
         self.executing = False
         self.interrupted = False
+        self._task: Optional[asyncio.Task] = None
 
-        # Create and reuse event loop for performance
-        self._event_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._event_loop)
+        # One runner per session: its loop is created on the first execute()
+        # and reused afterwards, always in the calling thread
+        self._runner = asyncio.Runner()
 
-        # Setup logging for debugging
-        self.logger = logging.getLogger(__name__)
-        self._enable_debug_logging = config.get("debug", False)
+        # Setup logging for debugging; logger levels are left to the app's
+        # logging setup, this only opts the session in to debug output
+        self.logger = logger
+        self._enable_debug_logging = bool(config.get("debug", False))
 
     async def execute_async(self, user_input: str) -> str:
         """
@@ -262,46 +323,52 @@ class AgentSession:
             Agent's response
 
         Raises:
-            Exception: If execution fails
+            Exception: If execution fails (the agent's original exception is re-raised)
         """
         if self.executing:
             raise RuntimeError("Agent is already executing")
 
         self.executing = True
         self.interrupted = False
+        self._task = asyncio.current_task()
 
         try:
             # Log input
-            if self._enable_debug_logging:
-                self.logger.info("=" * 80)
-                self.logger.info("AGENT INPUT:")
-                self.logger.info(f"  User Input: {user_input}")
-                self.logger.info("=" * 80)
+            if self._enable_debug_logging and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(_HR)
+                self.logger.debug("AGENT INPUT:")
+                self.logger.debug("  User Input: %s", user_input)
+                self.logger.debug(_HR)
 
             # Run the agent (async)
             response = await self.agent.run(user_input)
 
             # Log response
-            if self._enable_debug_logging:
-                self.logger.info("=" * 80)
-                self.logger.info("AGENT OUTPUT:")
-                self.logger.info(f"  Response: {response[:200]}{'...' if len(response) > 200 else ''}")
-                self.logger.info(f"  Length: {len(response)} chars")
-                self.logger.info("=" * 80)
+            if self._enable_debug_logging and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(_HR)
+                self.logger.debug("AGENT OUTPUT:")
+                self.logger.debug(
+                    "  Response: %s%s", response[:200], "..." if len(response) > 200 else ""
+                )
+                self.logger.debug("  Length: %d chars", len(response))
+                self.logger.debug(_HR)
 
             return response
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             self.interrupted = True
             raise
 
-        except Exception as e:
-            if self._enable_debug_logging:
-                self.logger.error(f"Agent execution failed: {e}", exc_info=True)
-            raise Exception(f"Agent execution failed: {e}")
+        except Exception:
+            # Only debug sessions log the traceback (on stderr it would garble
+            # the UI); the level check skips formatting when ERROR is filtered
+            if self._enable_debug_logging and self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error("Agent execution failed", exc_info=True)
+            raise
 
         finally:
             self.executing = False
+            self._task = None
 
     def execute(self, user_input: str) -> str:
         """
@@ -314,17 +381,33 @@ class AgentSession:
             Agent's response
 
         Raises:
+            KeyboardInterrupt: If execution was interrupted
             Exception: If execution fails
         """
-        # Reuse the event loop created during initialization
-        return self._event_loop.run_until_complete(self.execute_async(user_input))
+        # Runner.run refuses to run inside an already running loop, and on
+        # Ctrl+C cancels the task and lets it unwind before re-raising
+        coro = self.execute_async(user_input)
+        try:
+            return self._runner.run(coro)
+        except KeyboardInterrupt:
+            self.interrupted = True
+            raise
+        except RuntimeError:
+            # Runner refused to start (running loop, closed runner); a no-op
+            # if the coroutine already ran
+            coro.close()
+            raise
+        except asyncio.CancelledError:
+            # Report interrupt() the same way as Ctrl+C so callers handle both alike
+            raise KeyboardInterrupt from None
 
     def interrupt(self):
-        """Signal the agent to stop execution."""
-        if self.executing:
+        """Stop the running execution at its next await point."""
+        task = self._task
+        if self.executing and task is not None and not task.done():
             self.interrupted = True
-            # Note: Actual interruption depends on agent implementation
-            # For now, we just set the flag
+            # May be called from the UI thread, so cancel on the task's own loop
+            task.get_loop().call_soon_threadsafe(task.cancel)
 
     def reset(self):
         """Reset the agent session (clear memory)."""
@@ -349,17 +432,13 @@ class AgentSession:
 
     def get_agent_type(self) -> str:
         """Get the type of agent."""
-        if isinstance(self.agent, SpoonReactMCP):
-            return "react-mcp"
-        elif isinstance(self.agent, SpoonReactAI):
-            return "react"
-        return "unknown"
+        return self._agent_type
 
     def close(self):
-        """Clean up resources (close event loop)."""
-        if hasattr(self, '_event_loop') and self._event_loop and not self._event_loop.is_closed():
-            self._event_loop.close()
+        """
+        Clean up resources (cancel leftover tasks and close the event loop).
 
-    def __del__(self):
-        """Destructor to ensure event loop is closed."""
-        self.close()
+        Skipped while a turn is still executing, since the loop is in use.
+        """
+        if not self.executing:
+            self._runner.close()
@@ -1,11 +1,58 @@
 """Configuration management for Orbiton Agent."""
 
+import copy
+import functools
 import json
 import os
 from pathlib import Path
 from typing import Any, Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed defaults keyed by (path, mtime_ns) so edits on disk still invalidate
+_DEFAULTS_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
+
+
+def _str_to_bool(value: str) -> bool:
+    """Convert string to boolean."""
+    return value.lower() in ("true", "1", "yes", "on")
+
+
+# Environment variable overrides: (env var, config path, optional converter)
+_ENV_MAPPINGS = (
+    ("ORBITON_LLM_MODEL", ("llm", "default_model"), None),
+    ("ORBITON_LLM_PROVIDER", ("llm", "default_provider"), None),
+    ("ORBITON_LLM_TEMPERATURE", ("llm", "temperature"), float),
+    ("ORBITON_LLM_MAX_TOKENS", ("llm", "max_tokens"), int),
+    ("ORBITON_AGENT_TYPE", ("agent", "type"), None),
+    ("ORBITON_UI_THEME", ("ui", "theme"), None),
+    ("ORBITON_UI_SHOW_THINKING", ("ui", "show_thinking"), _str_to_bool),
+    ("ORBITON_SESSION_SAVE_HISTORY", ("session", "save_history"), _str_to_bool),
+    ("ORBITON_SESSION_HISTORY_DIR", ("session", "history_dir"), None),
+)
+
+# Lookup tables for _apply_env_overrides
+_ENV_PREFIX = "ORBITON_"
+_ENV_VAR_NAMES = frozenset(name for name, _, _ in _ENV_MAPPINGS)
+_ENV_MAP_BY_NAME = {name: (keys, converter) for name, keys, converter in _ENV_MAPPINGS}
+
+# Shared read-only fallback for missing config sections
+_EMPTY: dict = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(key_path: str) -> tuple[str, ...]:
+    """Split a dot-notation config path (cached, since the same paths recur)."""
+    return tuple(key_path.split("."))
+
+
+# Whether load_dotenv() has already populated os.environ for this process
+_DOTENV_LOADED = False
+
 
 class ConfigManager:
     """Manages configuration loading, validation, and updates."""
@@ -42,28 +89,56 @@ class ConfigManager:
             self.config = self._merge_configs(self.config, custom_config)
 
         # Load and apply environment variables
-        load_dotenv()
+        self._load_dotenv_once()
         self._apply_env_overrides()
 
         return self.config
 
+    @staticmethod
+    def _load_dotenv_once():
+        """Load .env into the process environment the first time only."""
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
+
+    @classmethod
+    def reset_dotenv(cls):
+        """Force the next load() to re-read the .env file."""
+        global _DOTENV_LOADED
+        _DOTENV_LOADED = False
+
     def _load_defaults(self) -> dict[str, Any]:
-        """Load default configuration."""
-        if not self._defaults_path.exists():
+        """Load default configuration (parsed once per file version)."""
+        try:
+            stat = self._defaults_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Defaults file not found: {self._defaults_path}")
-        return self._load_json(self._defaults_path)
+
+        key = (str(self._defaults_path), stat.st_mtime_ns)
+        defaults = _DEFAULTS_CACHE.get(key)
+        if defaults is None:
+            defaults = self._load_json(self._defaults_path)
+            _DEFAULTS_CACHE[key] = defaults
+
+        # Return a copy so callers mutating the config don't poison the cache
+        return copy.deepcopy(defaults)
 
     def _load_json(self, path: Path) -> dict[str, Any]:
         """Load JSON file."""
         try:
-            with open(path, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            data = Path(path).read_bytes()
+            return orjson.loads(data) if orjson else json.loads(data)
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
             raise ValueError(f"Invalid JSON in {path}: {e}")
 
     def _merge_configs(self, base: dict, override: dict) -> dict:
         """
-        Recursively merge two configuration dictionaries.
+        Deep-merge two configuration dictionaries.
+
+        Nested dicts are only copied where the override actually descends
+        into them; untouched branches are shared with base.
 
         Args:
             base: Base configuration
@@ -72,62 +147,61 @@ class ConfigManager:
         Returns:
             Merged configuration
         """
-        result = base.copy()
-
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        result = dict(base)
+        stack = [(result, override)]
+
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    merged = dict(current)
+                    target[key] = merged
+                    stack.append((merged, value))
+                else:
+                    target[key] = value
 
         return result
 
     def _apply_env_overrides(self):
         """Apply environment variable overrides to configuration."""
-        # Map environment variables to config paths
-        env_mappings = {
-            "ORBITON_LLM_MODEL": ("llm", "default_model"),
-            "ORBITON_LLM_PROVIDER": ("llm", "default_provider"),
-            "ORBITON_LLM_TEMPERATURE": ("llm", "temperature", float),
-            "ORBITON_LLM_MAX_TOKENS": ("llm", "max_tokens", int),
-            "ORBITON_AGENT_TYPE": ("agent", "type"),
-            "ORBITON_UI_THEME": ("ui", "theme"),
-            "ORBITON_UI_SHOW_THINKING": ("ui", "show_thinking", self._str_to_bool),
-            "ORBITON_SESSION_SAVE_HISTORY": ("session", "save_history", self._str_to_bool),
-            "ORBITON_SESSION_HISTORY_DIR": ("session", "history_dir"),
-        }
-
-        for env_var, mapping in env_mappings.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                # Parse mapping (key1, key2, optional_converter)
-                keys = mapping[:-1] if len(mapping) > 2 and callable(mapping[-1]) else mapping
-                converter = mapping[-1] if len(mapping) > 2 and callable(mapping[-1]) else None
-
-                # Apply converter if provided
-                if converter:
-                    try:
-                        value = converter(value)
-                    except (ValueError, TypeError):
-                        continue
-
-                # Set value in config
-                self._set_nested(self.config, keys, value)
+        environ = os.environ
+
+        # Common case: no override is set at all
+        if _ENV_VAR_NAMES.isdisjoint(environ):
+            return
+
+        # Single pass over the environment, dispatching ORBITON_* names
+        for env_var, value in environ.items():
+            if not env_var.startswith(_ENV_PREFIX):
+                continue
+            mapping = _ENV_MAP_BY_NAME.get(env_var)
+            if mapping is None:
+                continue
+            keys, converter = mapping
+
+            # Apply converter if provided
+            if converter:
+                try:
+                    value = converter(value)
+                except (ValueError, TypeError):
+                    continue
+
+            # Set value in config
+            self._set_nested(self.config, keys, value)
 
     def _set_nested(self, config: dict, keys: tuple, value: Any):
         """Set a nested configuration value."""
         current = config
         for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
+            nxt = current.get(key)
+            if not isinstance(nxt, dict):
+                # Missing or non-dict intermediate: replace with a fresh dict
+                nxt = {}
+                current[key] = nxt
+            current = nxt
         current[keys[-1]] = value
 
-    @staticmethod
-    def _str_to_bool(value: str) -> bool:
-        """Convert string to boolean."""
-        return value.lower() in ("true", "1", "yes", "on")
-
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
@@ -139,7 +213,10 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split(".")
+        return self._get_nested(_split_path(key_path), default)
+
+    def _get_nested(self, keys: tuple, default: Any = None) -> Any:
+        """Get a nested configuration value."""
         value = self.config
 
         for key in keys:
@@ -158,8 +235,7 @@ class ConfigManager:
             key_path: Dot-separated path (e.g., "llm.temperature")
             value: Value to set
         """
-        keys = key_path.split(".")
-        self._set_nested(self.config, tuple(keys), value)
+        self._set_nested(self.config, _split_path(key_path), value)
 
     def save(self, path: Optional[Path] = None):
         """
@@ -173,8 +249,12 @@ class ConfigManager:
         if not save_path:
             raise ValueError("No save path provided and no config_path set")
 
-        with open(save_path, "w") as f:
-            json.dump(self.config, f, indent=2)
+        if orjson:
+            with open(save_path, "wb") as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(save_path, "w") as f:
+                json.dump(self.config, f, indent=2)
 
     def reload(self) -> dict[str, Any]:
         """Reload configuration from disk."""
@@ -189,30 +269,35 @@ class ConfigManager:
         """
         errors = []
 
-        # Check required fields
-        required_fields = [
-            "llm.default_provider",
-            "llm.default_model",
-            "agent.type",
-        ]
+        # Look up each section once
+        llm = self.config.get("llm", _EMPTY)
+        if not isinstance(llm, dict):
+            llm = _EMPTY
+        agent = self.config.get("agent", _EMPTY)
+        if not isinstance(agent, dict):
+            agent = _EMPTY
+        agent_type = agent.get("type")
 
-        for field in required_fields:
-            if self.get(field) is None:
-                errors.append(f"Required field missing: {field}")
+        # Check required fields
+        if llm.get("default_provider") is None:
+            errors.append("Required field missing: llm.default_provider")
+        if llm.get("default_model") is None:
+            errors.append("Required field missing: llm.default_model")
+        if agent_type is None:
+            errors.append("Required field missing: agent.type")
 
         # Validate temperature range
-        temp = self.get("llm.temperature")
+        temp = llm.get("temperature")
         if temp is not None and not (0.0 <= temp <= 1.0):
             errors.append(f"Invalid temperature: {temp} (must be between 0.0 and 1.0)")
 
         # Validate max_tokens
-        max_tokens = self.get("llm.max_tokens")
+        max_tokens = llm.get("max_tokens")
         if max_tokens is not None and max_tokens < 1:
             errors.append(f"Invalid max_tokens: {max_tokens} (must be positive)")
 
         # Validate agent type
         valid_agent_types = ["react", "react-mcp"]
-        agent_type = self.get("agent.type")
         if agent_type and agent_type not in valid_agent_types:
             errors.append(f"Invalid agent type: {agent_type} (must be one of {valid_agent_types})")
 
@@ -1,26 +1,72 @@
 """Main console application for Orbiton Agent."""
 
+import logging
 import sys
+import warnings
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
 
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
+# When run directly, make the orbiton-agent modules and spoon_ai (repository
+# root) importable; normal entry points (main.py) set this up themselves
+if __name__ == "__main__":
+    _agent_dir = Path(__file__).resolve().parent.parent
+    sys.path[:0] = [str(_agent_dir), str(_agent_dir.parent)]
+
+# Rich, agent, and state modules are imported inside ConsoleApp so that
+# importing this module (e.g. via the console package) stays cheap.
+
+# Static parts of the welcome panel; only the agent status line varies
+_WELCOME_HEADER = "Welcome to [bold cyan]Orbiton[/] - Your Prediction Market Research Partner"
+
+_WELCOME_BODY = """
+I'm a worldly-wise AI specializing in prediction markets. I cut through the noise
+to deliver insights that matter - no fluff, just facts. Let's dive in.
+
+[bold]Quick Start:[/]
+  • Type your question and press Enter
+  • Use [cyan]/help[/] for commands
+  • Press [cyan]ctrl+o[/] to expand/collapse details (coming in Phase 4)
+  • Press [cyan]ESC[/] to interrupt, [cyan]ctrl+c[/] to exit
+
+[bold]What I Can Research:[/]
+  • Token price trends and market movements
+  • Liquidity pool analysis (Uniswap and beyond)
+  • Wallet behavior and holder distribution
+  • Trading patterns and market sentiment
+""".strip()
 
-# Add parent to path for spoon_ai imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_WELCOME_PANEL_KWARGS = dict(
+    title="✨ Welcome",
+    title_align="left",
+    border_style="info",
+    padding=(1, 2),
+)
 
-from console.renderer import Renderer, SectionManager
-from console.input_handler import InputHandler
-from console.theme import orbiton_theme, SPINNER_THINKING
-from console.commands import CommandHandler
-from console.keybindings import KeyBindingManager
-from agents.factory import AgentFactory, AgentSession
-from agents.console_callback import ConsoleCallbackHandler
-from state.session import SessionManager
-from state.persistence import SessionPersistence, AutoSaver
+# spoon_ai loggers that are quieted outside debug mode
+_QUIET_LOGGERS = (
+    "spoon_ai",
+    "spoon_ai.llm",
+    "spoon_ai.llm.manager",
+    "spoon_ai.llm.providers",
+)
+
+_LOGGING_CONFIGURED = False
+
+
+def _configure_logging_once():
+    """Suppress spoon_ai logs and deprecation warnings (once per process)."""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    # Suppress deprecation warnings
+    warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+    _LOGGING_CONFIGURED = True
 
 
 class ConsoleApp:
@@ -34,75 +80,136 @@ class ConsoleApp:
             config: Configuration dictionary
             debug: Debug mode flag
         """
+        from rich.console import Console
+        from console.theme import orbiton_theme
+
         self.config = config
         self.debug = debug
 
+        # Resolve frequently read settings once
+        ui_config = config.get("ui", {})
+        session_config = config.get("session", {})
+        self._show_timestamps = bool(ui_config.get("show_timestamps", False))
+        self._show_thinking = bool(ui_config.get("show_thinking", True))
+        self._save_history = bool(session_config.get("save_history", True))
+        self._history_dir = session_config.get("history_dir", "~/.orbiton/history")
+        self._auto_save_interval = session_config.get("auto_save_interval", 60)
+
         # Configure logging for spoon_ai (suppress if not debug)
         if not debug:
-            import logging
-            import warnings
-
-            # Suppress spoon_ai logs
-            logging.getLogger("spoon_ai").setLevel(logging.WARNING)
-            logging.getLogger("spoon_ai.llm").setLevel(logging.WARNING)
-            logging.getLogger("spoon_ai.llm.manager").setLevel(logging.WARNING)
-            logging.getLogger("spoon_ai.llm.providers").setLevel(logging.WARNING)
+            _configure_logging_once()
 
-            # Suppress deprecation warnings
-            warnings.filterwarnings("ignore", category=DeprecationWarning)
-
-        # Initialize Rich console
+        # Initialize Rich console (used by nearly every code path)
         self.console = Console(theme=orbiton_theme)
 
-        # Initialize components
-        self.renderer = Renderer(console=self.console)
-        self.input_handler = InputHandler(console=self.console)
-        self.section_manager = SectionManager()
-
         # State
         self.running = False
         self.current_model = config.get("llm", {}).get("default_model", "unknown")
         self.current_agent_type = config.get("agent", {}).get("type", "react")
 
-        # Session management (Phase 5)
-        self.session_manager = SessionManager(
+        # Agent (Phase 3) is created on the first query, see _ensure_agent.
+        # The remaining components are built on first access (properties below).
+        self.agent_session = None
+        self._agent_inited = False
+        self._agent_init_error: Optional[str] = None
+
+    # Components
+
+    @cached_property
+    def renderer(self):
+        """Output renderer."""
+        from console.renderer import Renderer
+
+        return Renderer(console=self.console, show_timestamps=self._show_timestamps)
+
+    @cached_property
+    def input_handler(self):
+        """User input handler."""
+        from console.input_handler import InputHandler
+
+        return InputHandler(console=self.console)
+
+    @cached_property
+    def section_manager(self):
+        """Expandable section tracking."""
+        from console.renderer import SectionManager
+
+        return SectionManager()
+
+    @cached_property
+    def session_manager(self):
+        """Session management (Phase 5)."""
+        from state.session import SessionManager
+
+        return SessionManager(
             agent_type=self.current_agent_type,
             model=self.current_model,
         )
 
-        # Persistence (Phase 5)
-        history_dir = config.get("session", {}).get("history_dir", "~/.orbiton/history")
-        self.persistence = SessionPersistence(history_dir=history_dir)
+    @cached_property
+    def persistence(self):
+        """Persistence (Phase 5)."""
+        from state.persistence import SessionPersistence
+
+        return SessionPersistence(history_dir=self._history_dir)
+
+    @cached_property
+    def auto_saver(self):
+        """Auto-save (Phase 5)."""
+        from state.persistence import AutoSaver
 
-        # Auto-save (Phase 5)
-        auto_save_interval = config.get("session", {}).get("auto_save_interval", 60)
-        self.auto_saver = AutoSaver(
+        return AutoSaver(
             session_manager=self.session_manager,
             persistence=self.persistence,
-            interval=auto_save_interval,
+            interval=self._auto_save_interval,
         )
 
-        # Command handler (Phase 4)
-        self.command_handler = CommandHandler(app=self)
+    @cached_property
+    def command_handler(self):
+        """Command handler (Phase 4)."""
+        from console.commands import CommandHandler
+
+        return CommandHandler(app=self)
+
+    @cached_property
+    def key_binding_manager(self):
+        """Keyboard bindings (Phase 4)."""
+        from console.keybindings import KeyBindingManager
+
+        return KeyBindingManager(app=self)
+
+    @cached_property
+    def callback_handler(self):
+        """Agent callback handler (Phase 3)."""
+        from agents.console_callback import ConsoleCallbackHandler
 
-        # Keyboard bindings (Phase 4)
-        self.key_binding_manager = KeyBindingManager(app=self)
+        handler = ConsoleCallbackHandler(renderer=self.renderer)
+        handler.set_show_thinking(self._show_thinking)
+        return handler
 
-        # Initialize agent (Phase 3)
-        self.callback_handler = ConsoleCallbackHandler(renderer=self.renderer)
-        self.callback_handler.set_show_thinking(config.get("ui", {}).get("show_thinking", True))
+    def _ensure_agent(self):
+        """Create the agent session on first use."""
+        if self._agent_inited:
+            return
+        self._agent_inited = True
+
+        # An agent may already have been set up, e.g. via /agent switch
+        if self.agent_session is not None:
+            return
+
+        from agents.factory import AgentFactory, AgentSession
 
         try:
             agent = AgentFactory.create_agent(
                 agent_type=self.current_agent_type,
-                config=config,
+                config=self.config,
                 callback_handler=self.callback_handler,
             )
-            self.agent_session = AgentSession(agent=agent, config=config)
+            self.agent_session = AgentSession(agent=agent, config=self.config)
         except Exception as e:
-            if debug:
+            if self.debug:
                 raise
-            # If agent creation fails, set to None and show warning later
+            # If agent creation fails, leave it unset and report on use
             self.agent_session = None
             self._agent_init_error = str(e)
 
@@ -112,18 +219,17 @@ class ConsoleApp:
 
         try:
             # Start auto-save if enabled
-            if self.config.get("session", {}).get("save_history", True):
+            if self._save_history:
                 self.auto_saver.start()
 
-            # Display header
-            self.renderer.render_header(
-                agent_name="Orbiton Agent",
-                model=self.current_model,
-                cwd=Path.cwd(),
-            )
-
-            # Display welcome message
-            self._display_welcome()
+            # Display header and welcome message (buffered into one write)
+            with self.console:
+                self.renderer.render_header(
+                    agent_name="Orbiton Agent",
+                    model=self.current_model,
+                    cwd=Path.cwd(),
+                )
+                self._display_welcome()
 
             # Main loop
             while self.running:
@@ -141,11 +247,15 @@ class ConsoleApp:
 
                 # Check if it's a command
                 if user_input.startswith("/"):
-                    self.command_handler.execute(user_input)
+                    # Buffer the command's output and write it out once
+                    with self.console:
+                        self.command_handler.execute(user_input)
                     continue
 
                 # Track user message in session (Phase 5)
                 self.session_manager.add_message(role="user", content=user_input)
+                if self._save_history:
+                    self.auto_saver.mark_dirty()
 
                 # Add user message to conversation history (above the input box)
                 self.renderer.render_user_message(user_input)
@@ -160,47 +270,32 @@ class ConsoleApp:
             if self.debug:
                 raise
         finally:
-            # Stop auto-saver
-            self.auto_saver.stop()
+            # Stop auto-saver (only if it was ever created)
+            if "auto_saver" in self.__dict__:
+                self.auto_saver.stop()
+            if self.agent_session is not None:
+                self.agent_session.close()
 
     def _display_welcome(self):
         """Display welcome message and help."""
+        from rich.panel import Panel
+
         # Check if agent initialized successfully
         agent_status = ""
         if self.agent_session:
             agent_type = self.agent_session.get_agent_type()
             agent_status = f"[green]✓[/] Agent ready: [cyan]{agent_type}[/]"
+        elif not self._agent_inited:
+            agent_status = (
+                f"[cyan]•[/] Agent will initialize on first query: "
+                f"[cyan]{self.current_agent_type}[/]"
+            )
         else:
             agent_status = f"[red]✗[/] Agent failed to initialize"
 
-        welcome_text = f"""
-Welcome to [bold cyan]Orbiton[/] - Your Prediction Market Research Partner
+        welcome_text = f"{_WELCOME_HEADER}\n\n{agent_status}\n\n{_WELCOME_BODY}"
 
-{agent_status}
-
-I'm a worldly-wise AI specializing in prediction markets. I cut through the noise
-to deliver insights that matter - no fluff, just facts. Let's dive in.
-
-[bold]Quick Start:[/]
-  • Type your question and press Enter
-  • Use [cyan]/help[/] for commands
-  • Press [cyan]ctrl+o[/] to expand/collapse details (coming in Phase 4)
-  • Press [cyan]ESC[/] to interrupt, [cyan]ctrl+c[/] to exit
-
-[bold]What I Can Research:[/]
-  • Token price trends and market movements
-  • Liquidity pool analysis (Uniswap and beyond)
-  • Wallet behavior and holder distribution
-  • Trading patterns and market sentiment
-        """.strip()
-
-        panel = Panel(
-            welcome_text,
-            title="✨ Welcome",
-            title_align="left",
-            border_style="info",
-            padding=(1, 2),
-        )
+        panel = Panel(welcome_text, **_WELCOME_PANEL_KWARGS)
         self.console.print(panel)
         self.console.print()
 
@@ -212,10 +307,12 @@ to deliver insights that matter - no fluff, just facts. Let's dive in.
         Args:
             message: User message
         """
+        self._ensure_agent()
+
         # Check if agent is initialized
         if not self.agent_session:
             self.renderer.render_error(
-                f"Agent failed to initialize: {getattr(self, '_agent_init_error', 'Unknown error')}\n\n"
+                f"Agent failed to initialize: {self._agent_init_error or 'Unknown error'}\n\n"
                 "Please check your configuration and API keys.",
                 title="Agent Error"
             )
@@ -230,13 +327,12 @@ to deliver insights that matter - no fluff, just facts. Let's dive in.
             # Track agent response in session (Phase 5)
             if response and isinstance(response, str):
                 self.session_manager.add_message(role="agent", content=response)
+                if self._save_history:
+                    self.auto_saver.mark_dirty()
 
                 # Only display if not already shown via callbacks
                 if not hasattr(self.callback_handler, '_response_shown'):
-                    self.renderer.render_agent_message(
-                        response,
-                        timestamp=datetime.now() if self.config.get("ui", {}).get("show_timestamps") else None
-                    )
+                    self.renderer.render_agent_message(response)
 
         except KeyboardInterrupt:
             self.renderer.render_warning("Interrupted by user")
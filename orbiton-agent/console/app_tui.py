@@ -2,12 +2,24 @@
 
 import sys
 import asyncio
+import atexit
+import collections
+import concurrent.futures
+import json
+import logging
+import os
+import re
+import warnings
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
-# Add parent to path for spoon_ai imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# When run directly, make the orbiton-agent modules and spoon_ai (repository
+# root) importable; normal entry points (main.py) set this up themselves
+if __name__ == "__main__":
+    _agent_dir = Path(__file__).resolve().parent.parent
+    sys.path[:0] = [str(_agent_dir), str(_agent_dir.parent)]
 
 from console.tui import TUIApp
 from console.commands import CommandHandler
@@ -15,8 +27,143 @@ from agents.factory import AgentFactory, AgentSession
 from state.session import SessionManager
 from state.persistence import SessionPersistence, AutoSaver
 from spoon_ai.callbacks.base import BaseCallbackHandler
-import os
-from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Matches tool input that looks like a JSON object, without copying the string
+_JSON_OBJECT_START = re.compile(r"\s*\{")
+
+# MCP server chatter that leaks into tool output ([GMCPT]/[MCP] log lines,
+# stdio banners and key hints)
+_MCP_NOISE_RE = re.compile(
+    r"^\s*(?:\[GMCPT\]|\[MCP\]|> \[GMCPT\])"
+    r"|listening on stdio|ctrl\+l clear|ctrl\+c exit"
+)
+
+# Cheap substring probes: output containing none of these has no noise lines
+_MCP_NOISE_MARKERS = ("[GMCPT]", "[MCP]", "listening on stdio", "ctrl+l clear", "ctrl+c exit")
+
+
+# Static TUI help text, one history line per entry
+_HELP_LINES: tuple[str, ...] = (
+    "",
+    "=" * 70,
+    "ORBITON AGENT - AVAILABLE COMMANDS",
+    "=" * 70,
+    "",
+    "CORE COMMANDS:",
+    "  /help, /h              - Show this help message",
+    "  /clear, /cls           - Clear the screen",
+    "  /exit, /quit, /q       - Exit the application",
+    "",
+    "CONFIGURATION:",
+    "  /config                - Show current configuration",
+    "  /config get <key>      - Get configuration value",
+    "  /config set <key> <val> - Set configuration value",
+    "",
+    "AGENT MANAGEMENT:",
+    "  /agent                 - Show current agent",
+    "  /agent list            - List available agents",
+    "  /agent <type>          - Switch agent (react/mcp)",
+    "",
+    "MODEL MANAGEMENT:",
+    "  /model                 - Show current model",
+    "  /model list            - List available models",
+    "  /model <name>          - Switch to model",
+    "",
+    "SESSION MANAGEMENT:",
+    "  /history               - Show all conversation history",
+    "  /history <N>           - Show last N messages",
+    "  /save                  - Save to default file",
+    "  /save <file>           - Save to specific file (.md/.json/.txt)",
+    "",
+    "KEYBOARD SHORTCUTS:",
+    "  ESC                    - Interrupt ongoing task",
+    "  Ctrl+L                 - Clear screen",
+    "  Ctrl+C                 - Exit application",
+    "",
+    "EXAMPLES:",
+    "  /agent list            - See available agents",
+    "  /model gpt-4           - Switch to GPT-4",
+    "  /history 5             - Show last 5 messages",
+    "  /save my_chat.md       - Save conversation",
+    "  /config get llm.model  - Check current model",
+    "",
+    "=" * 70,
+    "",
+)
+
+# The help as one pre-joined info message; continuation lines carry the same
+# two-space indent add_info_message() gives the first line
+_HELP_TEXT = "\n  ".join(_HELP_LINES)
+
+
+# spoon_ai loggers that are quieted outside debug mode
+_QUIET_LOGGERS = (
+    "spoon_ai",
+    "spoon_ai.llm",
+    "spoon_ai.llm.manager",
+    "spoon_ai.llm.providers",
+)
+
+# Loggers turned up to DEBUG in debug mode
+_DEBUG_LOGGERS = _QUIET_LOGGERS + ("openai", "httpx", "agents.factory")
+
+
+def _set_logger_levels(names: tuple[str, ...], level: int):
+    """Set the level of each named logger, skipping ones already at it."""
+    for name in names:
+        named_logger = logging.getLogger(name)
+        if named_logger.level != level:
+            named_logger.setLevel(level)
+
+
+def _strip_ansi(text: str) -> str:
+    """
+    Remove ANSI SGR sequences (ESC [ <digits/;> m) from text.
+
+    Args:
+        text: Text that may contain color codes
+
+    Returns:
+        Text without the color codes
+    """
+    parts = []
+    start = 0
+    pos = text.find("\x1b[")
+    while pos >= 0:
+        end = text.find("m", pos + 2)
+        if end < 0:
+            break
+        if text[pos + 2:end].strip("0123456789;"):
+            # Not a color code, keep it and look further along
+            pos = text.find("\x1b[", pos + 2)
+            continue
+        parts.append(text[start:pos])
+        start = end + 1
+        pos = text.find("\x1b[", start)
+    parts.append(text[start:])
+    return "".join(parts)
+
+
+def _shorten(text: str, limit: int) -> str:
+    """Cut text to limit characters plus an ellipsis; short text is returned as is."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+# Null device, opened once and shared by every suppress_subprocess_output()
+try:
+    _DEVNULL_FD: Optional[int] = os.open(os.devnull, os.O_WRONLY)
+except OSError:
+    _DEVNULL_FD = None
+else:
+    atexit.register(os.close, _DEVNULL_FD)
 
 
 @contextmanager
@@ -31,6 +178,11 @@ def suppress_subprocess_output(debug=False):
         yield
         return
 
+    if _DEVNULL_FD is None:
+        # No null device to redirect to
+        yield
+        return
+
     # Save original file descriptors
     original_stdout_fd = os.dup(1)
     original_stderr_fd = os.dup(2)
@@ -38,21 +190,29 @@ def suppress_subprocess_output(debug=False):
     try:
         # Redirect to devnull at the file descriptor level
         # This catches output from subprocesses too
-        devnull_fd = os.open(os.devnull, os.O_WRONLY)
-        os.dup2(devnull_fd, 1)
-        os.dup2(devnull_fd, 2)
-        os.close(devnull_fd)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(_DEVNULL_FD, 1)
+        os.dup2(_DEVNULL_FD, 2)
 
         yield
 
     finally:
-        # Restore original file descriptors
+        # Restore original file descriptors (flushing Python-level buffers
+        # first so suppressed prints don't leak out afterwards)
+        sys.stdout.flush()
+        sys.stderr.flush()
         os.dup2(original_stdout_fd, 1)
         os.dup2(original_stderr_fd, 2)
         os.close(original_stdout_fd)
         os.close(original_stderr_fd)
 
 
+# Status sentinel kept in TUICallbackHandler._last_status (interned so the
+# repeated comparisons hit the identity fast path)
+_STATUS_THINKING = sys.intern("thinking")
+
+
 class TUICallbackHandler(BaseCallbackHandler):
     """Callback handler that updates the TUI."""
 
@@ -67,12 +227,13 @@ class TUICallbackHandler(BaseCallbackHandler):
         self.tui = tui
         self.show_thinking = True
         self._last_status = None  # Cache to avoid redundant updates
+        self._status_cache: dict[str, str] = {}  # tool name -> status text
 
     def on_llm_start(self, **kwargs):
         """Called when LLM starts."""
-        if self.show_thinking and self._last_status != "thinking":
-            self._last_status = "thinking"
-            self.tui.set_status("Thinking...", style="thinking")
+        if self.show_thinking and self._last_status != _STATUS_THINKING:
+            self._last_status = _STATUS_THINKING
+            self.tui.call_from_thread(self.tui.set_status, "Thinking...", style="thinking")
 
     def on_llm_new_token(self, token: str, **kwargs):
         """Called when LLM generates a new token."""
@@ -82,34 +243,46 @@ class TUICallbackHandler(BaseCallbackHandler):
     def on_llm_end(self, response, **kwargs):
         """Called when LLM finishes."""
         self._last_status = None
-        self.tui.clear_status()
+        self.tui.call_from_thread(self.tui.clear_status)
 
     def on_llm_error(self, error: Exception, **kwargs):
         """Called when LLM encounters an error."""
         self._last_status = None
-        self.tui.add_error_message(f"LLM Error: {str(error)}")
-        self.tui.clear_status()
+        self.tui.call_from_thread(self.tui.add_error_message, f"LLM Error: {str(error)}")
+        self.tui.call_from_thread(self.tui.clear_status)
 
     def on_tool_start(self, serialized, input_str, **kwargs):
         """Called when tool execution starts."""
         tool_name = serialized.get("name", "unknown_tool")
 
         # Parse arguments properly for better display
-        try:
-            import json
-            if input_str.strip().startswith("{"):
-                args = json.loads(input_str)
-            else:
-                # For simple string inputs
-                args = {"query": input_str[:50] + "..." if len(input_str) > 50 else input_str}
-        except:
-            args = {"input": input_str[:50] + "..." if len(input_str) > 50 else input_str}
+        if isinstance(input_str, dict):
+            # Some tool wrappers pass structured input instead of a string
+            args = input_str
+        elif not isinstance(input_str, str):
+            args = {"input": _shorten(str(input_str), 50)}
+        elif _JSON_OBJECT_START.match(input_str):
+            try:
+                args = _json_loads(input_str)
+            except ValueError:
+                args = {"input": _shorten(input_str, 50)}
+        else:
+            # For simple string inputs
+            args = {"query": _shorten(input_str, 50)}
+
+        self.tui.call_from_thread(self.tui.add_tool_action, tool_name, args)
 
-        self.tui.add_tool_action(tool_name, args)
+        # Tool names come from a small fixed set, so interning stays bounded
+        status = sys.intern(f"tool_{tool_name}")
+        if self._last_status == status:
+            return
+        self._last_status = status
 
-        if self._last_status != f"tool_{tool_name}":
-            self._last_status = f"tool_{tool_name}"
-            self.tui.set_status(f"Executing {tool_name}...", style="status")
+        message = self._status_cache.get(tool_name)
+        if message is None:
+            message = f"Executing {tool_name}..."
+            self._status_cache[tool_name] = message
+        self.tui.call_from_thread(self.tui.set_status, message, style="status")
 
     def on_tool_end(self, output: str, **kwargs):
         """Called when tool execution ends."""
@@ -117,34 +290,38 @@ class TUICallbackHandler(BaseCallbackHandler):
 
         # Filter out MCP debug messages (lines starting with [GMCPT], [MCP], etc.)
         if output:
-            lines = output.split('\n')
-            filtered_lines = [
-                line for line in lines
-                if not (
-                    line.strip().startswith('[GMCPT]') or
-                    line.strip().startswith('[MCP]') or
-                    line.strip().startswith('> [GMCPT]') or
-                    'listening on stdio' in line or
-                    'ctrl+l clear' in line or
-                    'ctrl+c exit' in line
-                )
-            ]
-            output = '\n'.join(filtered_lines).strip()
+            output = output.strip()
+
+            # Only lines overlapping the first 500 chars can reach the display,
+            # so large outputs are only probed up to the end of that line
+            head = output
+            if len(output) > 500:
+                cut = output.find('\n', 500)
+                if cut >= 0:
+                    head = output[:cut]
+
+            # Only split and filter when a noise marker is actually present
+            if any(marker in head for marker in _MCP_NOISE_MARKERS):
+                output = '\n'.join(
+                    line for line in output.splitlines()
+                    if not _MCP_NOISE_RE.search(line)
+                ).strip()
 
         # Truncate very long outputs for performance
-        truncated_output = output[:500] if len(output) > 500 else output
+        if len(output) > 500:
+            output = output[:500]
 
         # Only add if there's actual content after filtering
-        if truncated_output:
-            self.tui.add_tool_result(truncated_output)
+        if output:
+            self.tui.call_from_thread(self.tui.add_tool_result, output)
 
-        self.tui.clear_status()
+        self.tui.call_from_thread(self.tui.clear_status)
 
     def on_tool_error(self, error: Exception, **kwargs):
         """Called when tool execution errors."""
         self._last_status = None
-        self.tui.add_error_message(f"Tool Error: {str(error)}")
-        self.tui.clear_status()
+        self.tui.call_from_thread(self.tui.add_error_message, f"Tool Error: {str(error)}")
+        self.tui.call_from_thread(self.tui.clear_status)
 
     def on_agent_finish(self, finish, **kwargs):
         """Called when agent finishes."""
@@ -152,19 +329,80 @@ class TUICallbackHandler(BaseCallbackHandler):
         if hasattr(finish, 'return_values'):
             output = finish.return_values.get('output', '')
             if output:
-                self.tui.add_agent_message(output)
+                self.tui.call_from_thread(self.tui.add_agent_message, output)
         elif hasattr(finish, 'output'):
-            self.tui.add_agent_message(finish.output)
+            self.tui.call_from_thread(self.tui.add_agent_message, finish.output)
 
     def on_chain_error(self, error: Exception, **kwargs):
         """Called when chain errors."""
-        self.tui.add_error_message(f"Chain Error: {str(error)}")
+        self.tui.call_from_thread(self.tui.add_error_message, f"Chain Error: {str(error)}")
 
     def set_show_thinking(self, show: bool):
         """Enable or disable thinking display."""
         self.show_thinking = show
 
 
+class _MockConsole:
+    """Console stand-in that routes print() output to TUI info messages."""
+
+    # Output goes to the TUI history pane, so commands should emit plain text
+    is_terminal = False
+
+    def __init__(self, tui):
+        self.tui = tui
+
+    # Output buffering (``with console:``) is a no-op: each print is already
+    # a single history append
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+    def print(self, *args, **kwargs):
+        """Convert print to TUI message (simplified for performance)."""
+        # Fast path: simple string conversion without Rich overhead
+        text_parts = []
+        for arg in args:
+            arg_str = str(arg)
+            # Remove ANSI codes if present
+            if '\x1b[' in arg_str:
+                arg_str = _strip_ansi(arg_str)
+            text_parts.append(arg_str)
+
+        message = " ".join(text_parts)
+        if message.strip():
+            self.tui.add_info_message(message)
+
+
+class _TUIRenderer:
+    """Minimal Renderer replacement that draws into the TUI."""
+
+    def __init__(self, tui):
+        self.tui = tui
+        # Mock console for Rich operations
+        self.console = _MockConsole(tui)
+
+    def render_info(self, msg):
+        self.tui.add_info_message(msg)
+
+    def render_success(self, msg):
+        self.tui.add_success_message(msg)
+
+    def render_warning(self, msg):
+        self.tui.add_warning_message(msg)
+
+    def render_error(self, msg, title="Error"):
+        self.tui.add_error_message(f"{title}: {msg}")
+
+    def clear_screen(self):
+        self.tui.clear_history()
+
+    def render_header(self, agent_name, model, cwd):
+        # TUI header is static
+        pass
+
+
 class ConsoleTUIApp:
     """Main console application with full-screen TUI."""
 
@@ -180,9 +418,6 @@ class ConsoleTUIApp:
         self.debug = debug
 
         # Configure logging for debugging
-        import logging
-        import warnings
-
         if debug:
             # Enable detailed debug logging
             logging.basicConfig(
@@ -194,27 +429,14 @@ class ConsoleTUIApp:
                 ]
             )
 
-            # Enable spoon_ai debug logs
-            logging.getLogger("spoon_ai").setLevel(logging.DEBUG)
-            logging.getLogger("spoon_ai.llm").setLevel(logging.DEBUG)
-            logging.getLogger("spoon_ai.llm.manager").setLevel(logging.DEBUG)
-            logging.getLogger("spoon_ai.llm.providers").setLevel(logging.DEBUG)
-
-            # Enable OpenAI SDK debug logging
-            logging.getLogger("openai").setLevel(logging.DEBUG)
-            logging.getLogger("httpx").setLevel(logging.DEBUG)
-
-            # Enable agent debug logging
-            logging.getLogger("agents.factory").setLevel(logging.DEBUG)
+            # Enable spoon_ai, OpenAI SDK and agent debug logs
+            _set_logger_levels(_DEBUG_LOGGERS, logging.DEBUG)
 
             print(f"[DEBUG] Logging enabled - logs will be written to logs/orbiton_debug.log")
 
         else:
             # Suppress spoon_ai logs
-            logging.getLogger("spoon_ai").setLevel(logging.WARNING)
-            logging.getLogger("spoon_ai.llm").setLevel(logging.WARNING)
-            logging.getLogger("spoon_ai.llm.manager").setLevel(logging.WARNING)
-            logging.getLogger("spoon_ai.llm.providers").setLevel(logging.WARNING)
+            _set_logger_levels(_QUIET_LOGGERS, logging.WARNING)
 
             # Suppress deprecation warnings
             warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -248,6 +470,15 @@ class ConsoleTUIApp:
             on_input=self._handle_user_input,
         )
 
+        # TUIApp._handle_input already calls _handle_user_input on an
+        # asyncio.to_thread worker, so this is a second thread hop. Its only
+        # job is serialising agent turns: a message sent mid-turn queues here
+        # instead of hitting "already executing", and the input worker is
+        # released straight away for slash commands.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="agent-exec"
+        )
+
         # Initialize callback handler
         self.callback_handler = TUICallbackHandler(tui=self.tui)
         self.callback_handler.set_show_thinking(
@@ -255,24 +486,15 @@ class ConsoleTUIApp:
         )
 
         # Initialize agent
+        self._agent_init_error: Optional[str] = None
         try:
-            # Add debug flag to config for AgentSession logging
-            agent_config = {**config, "debug": debug}
+            # Add debug flag to config for AgentSession logging (a view
+            # over config, so nothing is copied)
+            agent_config = collections.ChainMap({"debug": debug}, config)
 
             # Suppress stdout/stderr during agent initialization to hide MCP tool init messages
             # Only do this in non-debug mode
-            if not debug:
-                import sys
-                import os
-                # Save original stdout/stderr
-                original_stdout = sys.stdout
-                original_stderr = sys.stderr
-                # Redirect to devnull
-                devnull = open(os.devnull, 'w')
-                sys.stdout = devnull
-                sys.stderr = devnull
-
-            try:
+            with suppress_subprocess_output(debug=debug):
                 # Create agent with callback handler to show tool usage in TUI
                 agent = AgentFactory.create_agent(
                     agent_type=self.current_agent_type,
@@ -280,12 +502,6 @@ class ConsoleTUIApp:
                     callback_handler=self.callback_handler,
                 )
                 self.agent_session = AgentSession(agent=agent, config=agent_config)
-            finally:
-                # Restore stdout/stderr
-                if not debug:
-                    sys.stdout = original_stdout
-                    sys.stderr = original_stderr
-                    devnull.close()
         except Exception as e:
             if debug:
                 raise
@@ -293,8 +509,12 @@ class ConsoleTUIApp:
             self.agent_session = None
             self._agent_init_error = str(e)
 
-        # Command handler (Phase 4) - Must be after agent_session is initialized
-        self._setup_command_wrapper()
+        # Command handler (Phase 4) - Must be after agent_session is initialized.
+        # The app itself provides what CommandHandler expects (renderer,
+        # console, shutdown) on top of the shared state attributes.
+        self.renderer = _TUIRenderer(self.tui)
+        self.console = self.renderer.console
+        self.command_handler = CommandHandler(app=self)
 
         # Override help command for TUI-specific display
         self._setup_tui_commands()
@@ -302,159 +522,16 @@ class ConsoleTUIApp:
         # Show welcome message
         self._show_welcome()
 
-    def _setup_command_wrapper(self):
-        """Set up command handler with TUI-specific wrapper."""
-        # Create a wrapper class that makes TUI compatible with CommandHandler
-        class TUIWrapper:
-            def __init__(self, tui_app):
-                self.tui = tui_app.tui
-                self.config = tui_app.config
-                self.debug = tui_app.debug
-                self.current_model = tui_app.current_model
-                self.current_agent_type = tui_app.current_agent_type
-                self.agent_session = tui_app.agent_session
-                self.session_manager = tui_app.session_manager
-
-                # Create a minimal renderer wrapper
-                class TUIRenderer:
-                    def __init__(self, tui):
-                        self.tui = tui
-                        # Create a mock console for Rich operations
-                        self.console = self._create_mock_console()
-
-                    def _create_mock_console(self):
-                        """Create a mock console that routes to TUI messages."""
-                        import re
-
-                        # Compile ANSI regex once for performance
-                        ansi_pattern = re.compile(r'\x1b\[[0-9;]*m')
-
-                        class MockConsole:
-                            def __init__(self, tui):
-                                self.tui = tui
-                                self._ansi_pattern = ansi_pattern
-
-                            def print(self, *args, **kwargs):
-                                """Convert print to TUI message (simplified for performance)."""
-                                # Fast path: simple string conversion without Rich overhead
-                                text_parts = []
-                                for arg in args:
-                                    arg_str = str(arg)
-                                    # Remove ANSI codes if present
-                                    if '\x1b[' in arg_str:
-                                        arg_str = self._ansi_pattern.sub('', arg_str)
-                                    text_parts.append(arg_str)
-
-                                message = " ".join(text_parts)
-                                if message.strip():
-                                    self.tui.add_info_message(message)
-
-                        return MockConsole(self.tui)
-
-                    def render_info(self, msg):
-                        self.tui.add_info_message(msg)
-
-                    def render_success(self, msg):
-                        self.tui.add_success_message(msg)
-
-                    def render_warning(self, msg):
-                        self.tui.add_warning_message(msg)
-
-                    def render_error(self, msg, title="Error"):
-                        self.tui.add_error_message(f"{title}: {msg}")
-
-                    def clear_screen(self):
-                        self.tui.clear_history()
-
-                    def render_header(self, agent_name, model, cwd):
-                        # TUI header is static
-                        pass
-
-                self.renderer = TUIRenderer(self.tui)
-                # Set console to the mock console from renderer
-                self.console = self.renderer.console
-
-            def shutdown(self):
-                self.tui.running = False
-
-        self._wrapper = TUIWrapper(self)
-        self.command_handler = CommandHandler(app=self._wrapper)
-
     def _setup_tui_commands(self):
         """Override specific commands for TUI-friendly display."""
         # Override the help command with TUI-specific version
         def tui_help_command(args):
             """Show help information in TUI format."""
-            self.tui.add_info_message("")
-            self.tui.add_info_message("=" * 70)
-            self.tui.add_info_message("ORBITON AGENT - AVAILABLE COMMANDS")
-            self.tui.add_info_message("=" * 70)
-            self.tui.add_info_message("")
-
-            # Core Commands
-            self.tui.add_info_message("CORE COMMANDS:")
-            self.tui.add_info_message("  /help, /h              - Show this help message")
-            self.tui.add_info_message("  /clear, /cls           - Clear the screen")
-            self.tui.add_info_message("  /exit, /quit, /q       - Exit the application")
-            self.tui.add_info_message("")
-
-            # Configuration
-            self.tui.add_info_message("CONFIGURATION:")
-            self.tui.add_info_message("  /config                - Show current configuration")
-            self.tui.add_info_message("  /config get <key>      - Get configuration value")
-            self.tui.add_info_message("  /config set <key> <val> - Set configuration value")
-            self.tui.add_info_message("")
-
-            # Agent Management
-            self.tui.add_info_message("AGENT MANAGEMENT:")
-            self.tui.add_info_message("  /agent                 - Show current agent")
-            self.tui.add_info_message("  /agent list            - List available agents")
-            self.tui.add_info_message("  /agent <type>          - Switch agent (react/mcp)")
-            self.tui.add_info_message("")
-
-            # Model Management
-            self.tui.add_info_message("MODEL MANAGEMENT:")
-            self.tui.add_info_message("  /model                 - Show current model")
-            self.tui.add_info_message("  /model list            - List available models")
-            self.tui.add_info_message("  /model <name>          - Switch to model")
-            self.tui.add_info_message("")
-
-            # Session Management
-            self.tui.add_info_message("SESSION MANAGEMENT:")
-            self.tui.add_info_message("  /history               - Show all conversation history")
-            self.tui.add_info_message("  /history <N>           - Show last N messages")
-            self.tui.add_info_message("  /save                  - Save to default file")
-            self.tui.add_info_message("  /save <file>           - Save to specific file (.md/.json/.txt)")
-            self.tui.add_info_message("")
-
-            # Keyboard Shortcuts
-            self.tui.add_info_message("KEYBOARD SHORTCUTS:")
-            self.tui.add_info_message("  ESC                    - Interrupt ongoing task")
-            self.tui.add_info_message("  Ctrl+L                 - Clear screen")
-            self.tui.add_info_message("  Ctrl+C                 - Exit application")
-            self.tui.add_info_message("")
-
-            # Examples
-            self.tui.add_info_message("EXAMPLES:")
-            self.tui.add_info_message("  /agent list            - See available agents")
-            self.tui.add_info_message("  /model gpt-4           - Switch to GPT-4")
-            self.tui.add_info_message("  /history 5             - Show last 5 messages")
-            self.tui.add_info_message("  /save my_chat.md       - Save conversation")
-            self.tui.add_info_message("  /config get llm.model  - Check current model")
-            self.tui.add_info_message("")
-            self.tui.add_info_message("=" * 70)
-            self.tui.add_info_message("")
-
-        # Register the TUI help command
-        self.command_handler.commands["/help"] = (
-            tui_help_command,
-            "Show help information",
-            ["/h"]
-        )
-        self.command_handler.commands["/h"] = (
-            tui_help_command,
-            "Show help information",
-            []
+            self.tui.add_info_message(_HELP_TEXT)
+
+        # Register the TUI help command (replaces /help and its /h alias)
+        self.command_handler.register_command(
+            "/help", tui_help_command, "Show help information", ["/h"]
         )
 
     def _show_welcome(self):
@@ -489,6 +566,7 @@ class ConsoleTUIApp:
 
         # Track user message in session (Phase 5)
         self.session_manager.add_message(role="user", content=text)
+        self.auto_saver.mark_dirty()
 
         # Process with agent
         self._process_message(text)
@@ -499,46 +577,66 @@ class ConsoleTUIApp:
         """
         Process user message with agent.
 
+        The agent turn runs on a dedicated worker thread so the caller
+        returns immediately; UI updates are posted back to the TUI loop.
+
         Args:
             message: User message
         """
+        tui = self.tui
+
         # Check if agent is initialized
         if not self.agent_session:
-            self.tui.add_error_message(
-                f"Agent failed to initialize: {getattr(self, '_agent_init_error', 'Unknown error')}"
+            tui.call_from_thread(
+                tui.add_error_message,
+                f"Agent failed to initialize: {self._agent_init_error or 'Unknown error'}"
+            )
+            tui.call_from_thread(
+                tui.add_info_message, "Please check your configuration and API keys."
             )
-            self.tui.add_info_message("Please check your configuration and API keys.")
             return
 
-        try:
-            # Execute with agent
-            # Note: This is a synchronous call, which will block the UI
-            # In a production app, we'd want to run this in a background thread
-            # and update the UI asynchronously
+        tui.call_from_thread(tui.set_status, "Processing...", style="status")
+
+        # Execute agent with callbacks enabled
+        # The callbacks will show tool usage and responses
+        future = self._executor.submit(self.agent_session.execute, message)
+        future.add_done_callback(self._on_agent_done)
 
-            self.tui.set_status("Processing...", style="status")
+    def _on_agent_done(self, future: concurrent.futures.Future):
+        """
+        Handle the result of an agent turn (runs on the worker thread).
+
+        Args:
+            future: Future returned by the agent executor
+        """
+        tui = self.tui
 
-            # Execute agent with callbacks enabled
-            # The callbacks will show tool usage and responses
-            response = self.agent_session.execute(message)
+        try:
+            response = future.result()
 
             # Track agent response in session (Phase 5)
             if response and isinstance(response, str):
                 self.session_manager.add_message(role="agent", content=response)
-                self.tui.add_agent_message(response)
+                self.auto_saver.mark_dirty()
+                tui.call_from_thread(tui.add_agent_message, response)
 
-            self.tui.clear_status()
+            tui.call_from_thread(tui.clear_status)
 
-        except KeyboardInterrupt:
-            self.tui.add_warning_message("Interrupted by user")
-            self.tui.clear_status()
+        except (KeyboardInterrupt, concurrent.futures.CancelledError):
+            tui.call_from_thread(tui.add_warning_message, "Interrupted by user")
+            tui.call_from_thread(tui.clear_status)
             self.agent_session.interrupt()
 
         except Exception as e:
-            self.tui.add_error_message(f"Execution Error: {str(e)}")
-            self.tui.clear_status()
+            tui.call_from_thread(tui.add_error_message, f"Execution Error: {str(e)}")
+            tui.call_from_thread(tui.clear_status)
             if self.debug:
-                raise
+                logger.exception("Agent execution failed")
+
+    def shutdown(self):
+        """Stop the TUI (used by the /exit command)."""
+        self.tui.running = False
 
     def run(self):
         """Run the TUI application."""
@@ -553,6 +651,9 @@ class ConsoleTUIApp:
         finally:
             # Stop auto-saver and save final state (Phase 5)
             self.auto_saver.stop()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            if self.agent_session is not None:
+                self.agent_session.close()
             self.tui.add_info_message("Goodbye! 👋")
 
     async def run_async(self):
@@ -568,6 +669,9 @@ class ConsoleTUIApp:
         finally:
             # Stop auto-saver and save final state (Phase 5)
             self.auto_saver.stop()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            if self.agent_session is not None:
+                self.agent_session.close()
             self.tui.add_info_message("Goodbye! 👋")
 
 
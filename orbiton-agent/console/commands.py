@@ -1,15 +1,178 @@
 """Command handlers and routing for Orbiton Agent console."""
 
+import functools
+import os
+import re
+import sys
 from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+
+from state.persistence import SessionPersistence
+
+# Help text markup, plus the panel and plain-text forms built from it at import
+_HELP_MARKUP = """
+[bold]Available Commands:[/]
+
+  [cyan]/help[/], [cyan]/h[/]              Show this help message
+  [cyan]/clear[/], [cyan]/cls[/]           Clear the screen
+  [cyan]/config[/]                         Show or manage configuration
+  [cyan]/agent[/]                          Manage agent settings
+  [cyan]/model[/]                          Manage model settings
+  [cyan]/history[/]                        Show conversation history
+  [cyan]/save[/] [file]                    Save conversation to file
+  [cyan]/exit[/], [cyan]/quit[/], [cyan]/q[/]      Exit the application
+  [cyan]/test[/]                           Test UI components (development)
+
+[bold]Keyboard Shortcuts:[/]
+
+  [cyan]ctrl+o[/]                 Expand/collapse detailed output (Phase 4)
+  [cyan]ESC[/]                    Interrupt ongoing task
+  [cyan]ctrl+c[/]                 Exit application
+  [cyan]ctrl+l[/]                 Clear screen
+
+[bold]Command Details:[/]
+
+  [cyan]/config[/]                 Show current configuration
+  [cyan]/config get <key>[/]       Get configuration value
+  [cyan]/config set <key> <val>[/] Set configuration value
+
+  [cyan]/agent[/]                  Show current agent
+  [cyan]/agent list[/]             List available agents
+  [cyan]/agent <type>[/]           Switch to agent type (react/mcp)
+
+  [cyan]/model[/]                  Show current model
+  [cyan]/model list[/]             List available models
+  [cyan]/model <name>[/]           Switch to model
+
+  [cyan]/history[/]                Show all conversation messages
+  [cyan]/history <N>[/]            Show last N messages
+
+  [cyan]/save[/]                   Save to default file
+  [cyan]/save <file>[/]            Save to specific file
+
+For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
+""".strip()
+
+_HELP_TEXT = Text.from_markup(_HELP_MARKUP)
+_HELP_PLAIN = _HELP_TEXT.plain
+
+_HELP_PANEL = Panel(
+    _HELP_TEXT,
+    title="📚 Help",
+    title_align="left",
+    border_style="info",
+    padding=(1, 2),
+)
+
+# Static listings for /agent list and /model list
+_AGENTS_TABLE = Table(title="Available Agents", show_header=True)
+_AGENTS_TABLE.add_column("Type", style="cyan")
+_AGENTS_TABLE.add_column("Description")
+_AGENTS_TABLE.add_row("react", "ReAct agent with reasoning and action")
+_AGENTS_TABLE.add_row("mcp", "ReAct agent with MCP server support")
+
+_MODELS_TABLE = Table(title="Available Models", show_header=True)
+_MODELS_TABLE.add_column("Model", style="cyan")
+_MODELS_TABLE.add_column("Provider")
+_MODELS_TABLE.add_row("claude-sonnet-4", "Anthropic")
+_MODELS_TABLE.add_row("claude-3-5-sonnet-20241022", "Anthropic")
+_MODELS_TABLE.add_row("gpt-4", "OpenAI")
+_MODELS_TABLE.add_row("gpt-4-turbo", "OpenAI")
+_MODELS_TABLE.add_row("gemini-pro", "Google")
+
+# /config overview layout: (title, config section, ((label, key), ...))
+_CONFIG_SECTIONS = (
+    ("LLM", "llm", (
+        ("Provider", "default_provider"),
+        ("Model", "default_model"),
+        ("Temperature", "temperature"),
+        ("Max Tokens", "max_tokens"),
+    )),
+    ("Agent", "agent", (
+        ("Type", "type"),
+        ("Memory", "memory_enabled"),
+        ("Max Iterations", "max_iterations"),
+    )),
+    ("UI", "ui", (
+        ("Theme", "theme"),
+        ("Show Thinking", "show_thinking"),
+        ("Syntax Highlighting", "syntax_highlighting"),
+    )),
+    ("Session", "session", (
+        ("Save History", "save_history"),
+        ("History Dir", "history_dir"),
+    )),
+)
+
+# /config set literals: bool, unsigned int, or signed decimal/exponent float
+_LITERAL_RE = re.compile(
+    r"(true|false)|(\d+)|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)",
+    re.IGNORECASE,
+)
+
+# Subcommand words mapped to their interned copies, so the handlers'
+# == comparisons against literals hit the identity fast path
+_SUBCOMMANDS = {
+    word: sys.intern(word)
+    for word in ("list", "current", "get", "set", "react", "mcp")
+}
+
+# /save file extension -> export format
+_EXPORT_FORMATS = {".md": "md", ".json": "json", ".txt": "txt"}
+
+# /history row formatting: max content width
+_HISTORY_PREVIEW_CHARS = 80
+
+
+def _format_hms(dt: datetime) -> str:
+    """Format a datetime as HH:MM:SS (same as strftime("%H:%M:%S"), without format parsing)."""
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
+def _format_file_stamp(dt: datetime) -> str:
+    """Format a datetime as YYYYmmdd_HHMMSS for default /save file names."""
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d}_"
+        f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation config key (cached, since the same keys recur)."""
+    return tuple(key_path.split("."))
+
+
+@functools.cache
+def _get_persistence() -> SessionPersistence:
+    """Shared SessionPersistence for /exit and /save (default history dir)."""
+    return SessionPersistence()
+
+
+@functools.cache
+def _agent_classes():
+    """
+    Import the agent factory on first use.
+
+    agents.factory pulls in spoon_ai, so it stays out of module import time.
+
+    Returns:
+        (AgentFactory, AgentSession) tuple
+    """
+    from agents.factory import AgentFactory, AgentSession
+    return AgentFactory, AgentSession
 
 
 class CommandHandler:
     """Handler for console commands."""
 
+    __slots__ = ("app", "commands", "aliases", "descriptions", "command_aliases")
+
     def __init__(self, app):
         """
         Initialize command handler.
@@ -18,7 +181,13 @@ class CommandHandler:
             app: ConsoleApp instance
         """
         self.app = app
-        self.commands: Dict[str, Tuple[Callable, str, List[str]]] = {}
+        # Canonical command name -> handler
+        self.commands: Dict[str, Callable] = {}
+        # Alias -> canonical command name
+        self.aliases: Dict[str, str] = {}
+        # Canonical command name -> description / aliases (for listings only)
+        self.descriptions: Dict[str, str] = {}
+        self.command_aliases: Dict[str, List[str]] = {}
         self._register_commands()
 
     def _register_commands(self):
@@ -56,10 +225,13 @@ class CommandHandler:
             description: Command description
             aliases: List of command aliases
         """
-        self.commands[name] = (handler, description, aliases or [])
+        aliases = aliases or []
+        self.commands[name] = handler
+        self.descriptions[name] = description
+        self.command_aliases[name] = aliases
         # Register aliases
-        for alias in (aliases or []):
-            self.commands[alias] = (handler, description, [])
+        for alias in aliases:
+            self.aliases[alias] = name
 
     def execute(self, command_string: str) -> bool:
         """
@@ -71,12 +243,16 @@ class CommandHandler:
         Returns:
             True if command was executed, False if unknown
         """
-        cmd_parts = command_string.strip().split()
+        # split() ignores surrounding whitespace; only the argument tail is split further
+        cmd_parts = command_string.split(None, 1)
         cmd_name = cmd_parts[0].lower()
-        cmd_args = cmd_parts[1:] if len(cmd_parts) > 1 else []
+        cmd_args = (
+            [_SUBCOMMANDS.get(arg, arg) for arg in cmd_parts[1].split()]
+            if len(cmd_parts) > 1 else []
+        )
 
-        if cmd_name in self.commands:
-            handler, _, _ = self.commands[cmd_name]
+        handler = self.commands.get(self.aliases.get(cmd_name, cmd_name))
+        if handler is not None:
             try:
                 handler(cmd_args)
                 return True
@@ -99,71 +275,40 @@ class CommandHandler:
         Returns:
             List of (name, description, aliases) tuples
         """
-        seen = set()
-        commands = []
-        for name, (_, description, aliases) in self.commands.items():
-            if name not in seen:
-                seen.add(name)
-                seen.update(aliases)
-                commands.append((name, description, aliases))
-        return sorted(commands, key=lambda x: x[0])
-
-    # Command implementations
-
-    def _cmd_help(self, args: List[str]):
-        """Show help information."""
-        help_text = """
-[bold]Available Commands:[/]
-
-  [cyan]/help[/], [cyan]/h[/]              Show this help message
-  [cyan]/clear[/], [cyan]/cls[/]           Clear the screen
-  [cyan]/config[/]                         Show or manage configuration
-  [cyan]/agent[/]                          Manage agent settings
-  [cyan]/model[/]                          Manage model settings
-  [cyan]/history[/]                        Show conversation history
-  [cyan]/save[/] [file]                    Save conversation to file
-  [cyan]/exit[/], [cyan]/quit[/], [cyan]/q[/]      Exit the application
-  [cyan]/test[/]                           Test UI components (development)
-
-[bold]Keyboard Shortcuts:[/]
+        return [
+            (name, self.descriptions[name], self.command_aliases[name])
+            for name in sorted(self.commands)
+        ]
 
-  [cyan]ctrl+o[/]                 Expand/collapse detailed output (Phase 4)
-  [cyan]ESC[/]                    Interrupt ongoing task
-  [cyan]ctrl+c[/]                 Exit application
-  [cyan]ctrl+l[/]                 Clear screen
-
-[bold]Command Details:[/]
+    def _print_block(self, *renderables: RenderableType):
+        """
+        Print renderables followed by a blank line in a single console.print.
 
-  [cyan]/config[/]                 Show current configuration
-  [cyan]/config get <key>[/]       Get configuration value
-  [cyan]/config set <key> <val>[/] Set configuration value
+        Args:
+            *renderables: Panels, tables or strings to print in order
+        """
+        self.app.console.print(Group(*renderables, ""))
 
-  [cyan]/agent[/]                  Show current agent
-  [cyan]/agent list[/]             List available agents
-  [cyan]/agent <type>[/]           Switch to agent type (react/mcp)
+    def _print_plain(self, text: str):
+        """
+        Print pre-rendered plain text followed by a blank line.
 
-  [cyan]/model[/]                  Show current model
-  [cyan]/model list[/]             List available models
-  [cyan]/model <name>[/]           Switch to model
+        Used instead of panels when output is not a terminal, so Rich skips
+        markup parsing and box layout.
 
-  [cyan]/history[/]                Show all conversation messages
-  [cyan]/history <N>[/]            Show last N messages
-
-  [cyan]/save[/]                   Save to default file
-  [cyan]/save <file>[/]            Save to specific file
+        Args:
+            text: Text to print as-is
+        """
+        self.app.console.print(f"{text}\n", markup=False, highlight=False)
 
-For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
-        """.strip()
+    # Command implementations
 
-        panel = Panel(
-            help_text,
-            title="📚 Help",
-            title_align="left",
-            border_style="info",
-            padding=(1, 2),
-        )
-        self.app.console.print(panel)
-        self.app.console.print()
+    def _cmd_help(self, args: List[str]):
+        """Show help information."""
+        if not self.app.console.is_terminal:
+            self._print_plain(_HELP_PLAIN)
+            return
+        self._print_block(_HELP_PANEL)
 
     def _cmd_clear(self, args: List[str]):
         """Clear screen and re-render header."""
@@ -178,10 +323,9 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
     def _cmd_exit(self, args: List[str]):
         """Exit the application."""
         # Auto-save if session manager exists
-        if hasattr(self.app, 'session_manager') and self.app.session_manager:
+        if self.app.session_manager is not None:
             try:
-                from state.persistence import SessionPersistence
-                persistence = SessionPersistence()
+                persistence = _get_persistence()
                 session_state = self.app.session_manager.get_session_state()
                 persistence.auto_save(session_state)
                 self.app.renderer.render_info("Session saved")
@@ -214,43 +358,32 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
 
     def _show_config(self):
         """Show current configuration."""
-        config_text = f"""
-[bold]Current Configuration:[/]
-
-[bold cyan]LLM:[/]
-  • Provider: {self.app.config.get('llm', {}).get('default_provider', 'N/A')}
-  • Model: {self.app.config.get('llm', {}).get('default_model', 'N/A')}
-  • Temperature: {self.app.config.get('llm', {}).get('temperature', 'N/A')}
-  • Max Tokens: {self.app.config.get('llm', {}).get('max_tokens', 'N/A')}
-
-[bold cyan]Agent:[/]
-  • Type: {self.app.config.get('agent', {}).get('type', 'N/A')}
-  • Memory: {self.app.config.get('agent', {}).get('memory_enabled', 'N/A')}
-  • Max Iterations: {self.app.config.get('agent', {}).get('max_iterations', 'N/A')}
-
-[bold cyan]UI:[/]
-  • Theme: {self.app.config.get('ui', {}).get('theme', 'N/A')}
-  • Show Thinking: {self.app.config.get('ui', {}).get('show_thinking', 'N/A')}
-  • Syntax Highlighting: {self.app.config.get('ui', {}).get('syntax_highlighting', 'N/A')}
-
-[bold cyan]Session:[/]
-  • Save History: {self.app.config.get('session', {}).get('save_history', 'N/A')}
-  • History Dir: {self.app.config.get('session', {}).get('history_dir', 'N/A')}
-        """.strip()
+        config = self.app.config
+        plain = not self.app.console.is_terminal
+        lines = ["Current Configuration:" if plain else "[bold]Current Configuration:[/]"]
+        for title, section_key, fields in _CONFIG_SECTIONS:
+            section = config.get(section_key, {})
+            lines.append("")
+            lines.append(f"{title}:" if plain else f"[bold cyan]{title}:[/]")
+            for label, key in fields:
+                lines.append(f"  • {label}: {section.get(key, 'N/A')}")
+
+        if plain:
+            self._print_plain("\n".join(lines))
+            return
 
         panel = Panel(
-            config_text,
+            "\n".join(lines),
             title="⚙️ Configuration",
             title_align="left",
             border_style="info",
             padding=(1, 2),
         )
-        self.app.console.print(panel)
-        self.app.console.print()
+        self._print_block(panel)
 
     def _get_config_value(self, key_path: str):
         """Get configuration value using dot notation."""
-        parts = key_path.split(".")
+        parts = _split_key_path(key_path)
         value = self.app.config
         for part in parts:
             if isinstance(value, dict) and part in value:
@@ -261,22 +394,21 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
 
     def _set_config_value(self, key_path: str, value: str):
         """Set configuration value using dot notation."""
-        # Try to parse value
+        # Classify the literal in a single regex pass
         parsed_value = value
-        if value.lower() == "true":
-            parsed_value = True
-        elif value.lower() == "false":
-            parsed_value = False
-        elif value.isdigit():
-            parsed_value = int(value)
-        else:
-            try:
-                parsed_value = float(value)
-            except ValueError:
-                pass  # Keep as string
+        match = _LITERAL_RE.fullmatch(value)
+        if match is not None:
+            boolean, integer, number = match.groups()
+            if boolean is not None:
+                parsed_value = boolean.lower() == "true"
+            elif integer is not None:
+                parsed_value = int(integer)
+            else:
+                parsed_value = float(number)
+        # Anything else is kept as a string
 
         # Update config
-        parts = key_path.split(".")
+        parts = _split_key_path(key_path)
         config = self.app.config
         for part in parts[:-1]:
             if part not in config:
@@ -294,14 +426,7 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
             self.app.renderer.render_info(f"Current agent: [cyan]{agent_type}[/]")
         elif args[0] == "list":
             # List available agents
-            agents = ["react", "mcp"]
-            table = Table(title="Available Agents", show_header=True)
-            table.add_column("Type", style="cyan")
-            table.add_column("Description")
-            table.add_row("react", "ReAct agent with reasoning and action")
-            table.add_row("mcp", "ReAct agent with MCP server support")
-            self.app.console.print(table)
-            self.app.console.print()
+            self._print_block(_AGENTS_TABLE)
         else:
             # Switch agent
             agent_type = args[0]
@@ -315,14 +440,14 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
             self.app.current_agent_type = agent_type
 
             try:
-                from agents.factory import AgentFactory, AgentSession
+                AgentFactory, AgentSession = _agent_classes()
 
                 agent = AgentFactory.create_agent(
                     agent_type=agent_type,
                     config=self.app.config,
                     callback_handler=self.app.callback_handler,
                 )
-                self.app.agent_session = AgentSession(agent=agent, config=self.app.config)
+                self._replace_agent_session(AgentSession(agent=agent, config=self.app.config))
                 self.app.renderer.render_success(f"Switched to agent: [cyan]{agent_type}[/]")
             except Exception as e:
                 self.app.renderer.render_error(f"Failed to switch agent: {e}", title="Agent Error")
@@ -334,16 +459,7 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
             self.app.renderer.render_info(f"Current model: [cyan]{self.app.current_model}[/]")
         elif args[0] == "list":
             # List available models
-            table = Table(title="Available Models", show_header=True)
-            table.add_column("Model", style="cyan")
-            table.add_column("Provider")
-            table.add_row("claude-sonnet-4", "Anthropic")
-            table.add_row("claude-3-5-sonnet-20241022", "Anthropic")
-            table.add_row("gpt-4", "OpenAI")
-            table.add_row("gpt-4-turbo", "OpenAI")
-            table.add_row("gemini-pro", "Google")
-            self.app.console.print(table)
-            self.app.console.print()
+            self._print_block(_MODELS_TABLE)
         else:
             # Switch model
             model = args[0]
@@ -352,21 +468,28 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
 
             # Recreate agent with new model
             try:
-                from agents.factory import AgentFactory, AgentSession
+                AgentFactory, AgentSession = _agent_classes()
 
                 agent = AgentFactory.create_agent(
                     agent_type=self.app.current_agent_type,
                     config=self.app.config,
                     callback_handler=self.app.callback_handler,
                 )
-                self.app.agent_session = AgentSession(agent=agent, config=self.app.config)
+                self._replace_agent_session(AgentSession(agent=agent, config=self.app.config))
                 self.app.renderer.render_success(f"Switched to model: [cyan]{model}[/]")
             except Exception as e:
                 self.app.renderer.render_error(f"Failed to switch model: {e}", title="Model Error")
 
+    def _replace_agent_session(self, session):
+        """Install a new agent session, closing the one it replaces."""
+        old_session = self.app.agent_session
+        self.app.agent_session = session
+        if old_session is not None:
+            old_session.close()
+
     def _cmd_history(self, args: List[str]):
         """Show conversation history."""
-        if not hasattr(self.app, 'session_manager') or not self.app.session_manager:
+        if self.app.session_manager is None:
             self.app.renderer.render_warning("Session manager not initialized")
             return
 
@@ -387,18 +510,24 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
         table.add_column("Role", style="cyan")
         table.add_column("Content")
 
+        # All messages share one schema, so probe the optional fields once
+        first = messages[0]
+        has_timestamp = hasattr(first, 'timestamp')
+        has_role = hasattr(first, 'role')
+
         for msg in messages:
-            timestamp = msg.timestamp.strftime("%H:%M:%S") if hasattr(msg, 'timestamp') else ""
-            role = msg.role if hasattr(msg, 'role') else "unknown"
-            content = msg.content[:80] + "..." if len(msg.content) > 80 else msg.content
+            timestamp = _format_hms(msg.timestamp) if has_timestamp else ""
+            role = msg.role if has_role else "unknown"
+            content = msg.content
+            if len(content) > _HISTORY_PREVIEW_CHARS:
+                content = f"{content[:_HISTORY_PREVIEW_CHARS - 3]}..."
             table.add_row(timestamp, role, content)
 
-        self.app.console.print(table)
-        self.app.console.print()
+        self._print_block(table)
 
     def _cmd_save(self, args: List[str]):
         """Save conversation to file."""
-        if not hasattr(self.app, 'session_manager') or not self.app.session_manager:
+        if self.app.session_manager is None:
             self.app.renderer.render_warning("Session manager not initialized")
             return
 
@@ -407,26 +536,19 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
             filename = " ".join(args)
         else:
             # Default filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _format_file_stamp(datetime.now())
             filename = f"conversation_{timestamp}.md"
 
-        # Ensure .md extension
-        if not filename.endswith(('.md', '.json', '.txt')):
+        # Determine format from extension (unknown extensions get .md appended)
+        format_type = _EXPORT_FORMATS.get(os.path.splitext(filename)[1].lower())
+        if format_type is None:
             filename += '.md'
+            format_type = 'md'
 
         try:
-            from state.persistence import SessionPersistence
-            persistence = SessionPersistence()
+            persistence = _get_persistence()
             session_state = self.app.session_manager.get_session_state()
 
-            # Determine format from extension
-            if filename.endswith('.json'):
-                format_type = 'json'
-            elif filename.endswith('.txt'):
-                format_type = 'txt'
-            else:
-                format_type = 'md'
-
             # Export and save
             output_path = persistence.export_session(session_state, filename, format=format_type)
             self.app.renderer.render_success(f"Conversation saved to: [cyan]{output_path}[/]")
@@ -438,22 +560,27 @@ For more information, visit: https://github.com/XSpoonAi/prediction-agent-spoon
 
     def _cmd_test(self, args: List[str]):
         """Test UI components (for development)."""
-        from rich.tree import Tree
+        # Buffer all component output and write it to the terminal once
+        with self.app.console:
+            self._render_test_components()
 
+    def _render_test_components(self):
+        """Render one of each UI component (used by /test)."""
         self.app.renderer.render_info("Testing UI components...")
         self.app.console.print()
 
-        # Test tool execution display
-        tree = self.app.renderer.render_tool_action(
-            "search_web", {"query": "Python rich library", "max_results": 10}
+        # Test tool execution display (nodes are added, then rendered once)
+        batch = self.app.renderer.begin_tool_batch()
+        action = self.app.renderer.render_tool_action(
+            "search_web", {"query": "Python rich library", "max_results": 10}, batch
         )
         self.app.renderer.render_tool_result(
             "Found 10 results\n\n1. Rich Documentation\n2. GitHub Repository\n3. Tutorial...",
-            tree,
+            action,
             expandable=True,
             expanded=False,
         )
-        self.app.renderer.render_tree(tree)
+        self.app.renderer.end_tool_batch(batch)
 
         # Test thinking mode
         self.app.renderer.render_thinking(
@@ -1,8 +1,9 @@
 """Simple demo of the TUI layout (no agent required)."""
 
-import sys
-import time
+import asyncio
+import itertools
 import random
+import sys
 from pathlib import Path
 
 # Add parent to path for imports
@@ -10,8 +11,27 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from console.tui import TUIApp
 
-
-def simulate_agent_response(tui: TUIApp, user_input: str):
+# Canned replies, shuffled once and then cycled through
+_RESPONSES = (
+    "I understand you're asking about: '{}'",
+    "Let me search for that information...",
+    "Here's what I found based on current market data:",
+    "The prediction markets suggest interesting trends in this area.",
+)
+_FINAL_RESPONSES = (
+    "Based on the available data, here are the key insights...",
+    "The market indicators suggest a positive trend.",
+    "This is an interesting question that requires deeper analysis.",
+    "Let me know if you need more specific information!",
+)
+_response_cycle = itertools.cycle(random.sample(_RESPONSES, len(_RESPONSES)))
+_final_cycle = itertools.cycle(random.sample(_FINAL_RESPONSES, len(_FINAL_RESPONSES)))
+
+# Pre-drawn coin flips deciding whether a turn simulates tool usage
+_tool_use_cycle = itertools.cycle([random.random() > 0.5 for _ in range(64)])
+
+
+async def simulate_agent_response(tui: TUIApp, user_input: str):
     """
     Simulate an agent processing a message.
 
@@ -21,31 +41,24 @@ def simulate_agent_response(tui: TUIApp, user_input: str):
     """
     # Simulate thinking
     tui.set_status("Thinking...", style="thinking")
-    time.sleep(0.5)
+    await asyncio.sleep(0.5)
 
     # Simulate agent response
-    responses = [
-        f"I understand you're asking about: '{user_input}'",
-        "Let me search for that information...",
-        "Here's what I found based on current market data:",
-        "The prediction markets suggest interesting trends in this area.",
-    ]
-
-    response = random.choice(responses)
+    response = next(_response_cycle).format(user_input)
     tui.add_agent_message(response)
     tui.clear_status()
 
     # Simulate tool usage (sometimes)
-    if random.random() > 0.5:
+    if next(_tool_use_cycle):
         tui.set_status("Searching web...", style="status")
-        time.sleep(0.3)
+        await asyncio.sleep(0.3)
 
         tui.add_tool_action(
             "search_web",
             {"query": user_input[:30], "max_results": 10}
         )
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
 
         tui.add_tool_result(
             "Found 10 results:\n"
@@ -64,23 +77,16 @@ def simulate_agent_response(tui: TUIApp, user_input: str):
     )
 
     # Final response
-    final_responses = [
-        "Based on the available data, here are the key insights...",
-        "The market indicators suggest a positive trend.",
-        "This is an interesting question that requires deeper analysis.",
-        "Let me know if you need more specific information!",
-    ]
-
-    tui.add_agent_message(random.choice(final_responses))
+    tui.add_agent_message(next(_final_cycle))
 
 
 def main():
     """Run the TUI demo."""
 
-    def on_user_input(text: str):
+    async def on_user_input(text: str):
         """Handle user input."""
-        # Simulate agent processing
-        simulate_agent_response(tui, text)
+        # Simulate agent processing on the UI event loop
+        await simulate_agent_response(tui, text)
 
     # Create TUI
     tui = TUIApp(
@@ -1,12 +1,22 @@
 """Input handling for Orbiton Agent console."""
 
+import collections
+import itertools
+import sys
 from typing import Optional, Callable
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.rule import Rule
+from rich.text import Text
 
 from .theme import SYMBOL_USER
 
+# Maximum number of inputs kept in history (oldest are dropped first)
+_HISTORY_LIMIT = 1000
+
+# Default prompt markup
+_DEFAULT_PROMPT = f"[prompt]{SYMBOL_USER}[/] "
+
 
 class InputHandler:
     """Handles user input in the console."""
@@ -19,9 +29,13 @@ class InputHandler:
             console: Rich Console instance
         """
         self.console = console
-        self.history: list[str] = []
+        self.history: collections.deque[str] = collections.deque(maxlen=_HISTORY_LIMIT)
         self.history_index: int = -1
 
+        # Renderables reused for every prompt
+        self._rule = Rule(style="cyan", characters="─")
+        self._prompt_text = Text.from_markup(_DEFAULT_PROMPT)
+
     def get_input(self, prompt: str = "", multiline: bool = False) -> Optional[str]:
         """
         Get user input with bottom input box (always at bottom of screen).
@@ -33,18 +47,14 @@ class InputHandler:
         Returns:
             User input or None if interrupted
         """
-        if not prompt:
-            prompt = f"[prompt]{SYMBOL_USER}[/] "
-
         try:
             # Show input box at bottom (with top and bottom lines)
-            self.console.print(Rule(style="cyan", characters="─"))
-
             if multiline:
-                user_input = self._get_multiline_input(prompt)
+                self.console.print(self._rule)
+                user_input = self._get_multiline_input(prompt or _DEFAULT_PROMPT)
             else:
-                # Simple input with bottom border
-                self.console.print(prompt, end="")
+                # Top border and prompt in one print, then simple input
+                self.console.print(self._rule, prompt or self._prompt_text, end="")
                 user_input = input()
 
                 if user_input:
@@ -52,7 +62,7 @@ class InputHandler:
                     self.history_index = len(self.history)
 
             # Show bottom border
-            self.console.print(Rule(style="cyan", characters="─"))
+            self.console.print(self._rule)
 
             return user_input
 
@@ -72,14 +82,26 @@ class InputHandler:
         lines = []
         self.console.print(f"{prompt} [dim](empty line to finish)[/]")
 
-        while True:
-            try:
-                line = input("  ")
-                if not line:  # Empty line ends input
+        if sys.stdin.isatty():
+            while True:
+                try:
+                    line = input("  ")
+                    if not line:  # Empty line ends input
+                        break
+                    lines.append(line)
+                except (KeyboardInterrupt, EOFError):
                     break
-                lines.append(line)
-            except (KeyboardInterrupt, EOFError):
-                break
+        else:
+            # Piped/pasted input: read buffered lines directly instead of
+            # going through input() once per line
+            try:
+                for line in sys.stdin:
+                    line = line.rstrip("\n")
+                    if not line:  # Empty line ends input
+                        break
+                    lines.append(line)
+            except KeyboardInterrupt:
+                pass
 
         full_input = "\n".join(lines)
         if full_input:
@@ -99,8 +121,9 @@ class InputHandler:
             List of previous inputs
         """
         if limit:
-            return self.history[-limit:]
-        return self.history.copy()
+            start = max(0, len(self.history) - limit)
+            return list(itertools.islice(self.history, start, None))
+        return list(self.history)
 
     def clear_history(self):
         """Clear input history."""
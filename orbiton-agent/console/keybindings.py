@@ -1,5 +1,6 @@
 """Keyboard bindings for Orbiton Agent console."""
 
+from pathlib import Path
 from typing import Optional
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.keys import Keys
@@ -59,24 +60,18 @@ class KeyBindingManager:
         In Phase 4 MVP, this will toggle the last expandable section.
         In future, this could toggle sections based on cursor position.
         """
-        if not hasattr(self.app, 'section_manager') or not self.app.section_manager:
+        if self.app.section_manager is None:
             self.app.renderer.render_warning("Section manager not available")
             return
 
-        # Get the last expandable section
-        sections = self.app.section_manager.get_all_sections()
-        if not sections:
+        # Get the last expandable section (without listing all of them)
+        last_section = self.app.section_manager.get_last_section()
+        if last_section is None:
             self.app.renderer.render_info("No expandable sections available")
             return
 
         # Toggle the last section
-        last_section = sections[-1]
-        section_id = id(last_section)
-
-        # Toggle state
-        current_state = self.app.section_manager.is_expanded(section_id)
-        new_state = not current_state
-        self.app.section_manager.set_expanded(section_id, new_state)
+        new_state = self.app.section_manager.toggle(last_section.section_id)
 
         # Show feedback
         state_text = "expanded" if new_state else "collapsed"
@@ -88,13 +83,14 @@ class KeyBindingManager:
 
         This will gracefully stop the currently running agent.
         """
-        if not self.app.agent_session:
+        agent_session = self.app.agent_session
+        if agent_session is None:
             return
 
         # Check if agent is currently executing
-        if hasattr(self.app.agent_session, '_executing') and self.app.agent_session._executing:
+        if agent_session.executing:
             self.app.renderer.render_warning("⚠ Interrupting agent...")
-            self.app.agent_session.interrupt()
+            agent_session.interrupt()
 
             # Show interruption message
             self.app.console.print()
@@ -109,8 +105,6 @@ class KeyBindingManager:
 
         This is similar to /clear command but triggered by keyboard.
         """
-        from pathlib import Path
-
         self.app.renderer.clear_screen()
         self.app.renderer.render_header(
             agent_name="Orbiton Agent",
@@ -141,35 +135,31 @@ class SectionNavigator:
 
     def next_section(self):
         """Move to the next expandable section."""
-        sections = self.section_manager.get_all_sections()
-        if sections:
-            self.current_section_index = (self.current_section_index + 1) % len(sections)
-            return sections[self.current_section_index]
+        count = self.section_manager.section_count()
+        if count:
+            self.current_section_index = (self.current_section_index + 1) % count
+            return self.section_manager.get_section_at(self.current_section_index)
         return None
 
     def previous_section(self):
         """Move to the previous expandable section."""
-        sections = self.section_manager.get_all_sections()
-        if sections:
-            self.current_section_index = (self.current_section_index - 1) % len(sections)
-            return sections[self.current_section_index]
+        count = self.section_manager.section_count()
+        if count:
+            self.current_section_index = (self.current_section_index - 1) % count
+            return self.section_manager.get_section_at(self.current_section_index)
         return None
 
     def get_current_section(self):
         """Get the currently focused section."""
-        sections = self.section_manager.get_all_sections()
-        if sections and 0 <= self.current_section_index < len(sections):
-            return sections[self.current_section_index]
+        if 0 <= self.current_section_index < self.section_manager.section_count():
+            return self.section_manager.get_section_at(self.current_section_index)
         return None
 
     def toggle_current_section(self):
         """Toggle the currently focused section."""
         section = self.get_current_section()
         if section:
-            section_id = id(section)
-            current_state = self.section_manager.is_expanded(section_id)
-            self.section_manager.set_expanded(section_id, not current_state)
-            return not current_state
+            return self.section_manager.toggle(section.section_id)
         return None
 
 
@@ -1,11 +1,13 @@
 """UI rendering engine for Orbiton Agent console."""
 
+import functools
 import os
+import re
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.tree import Tree
 from rich.syntax import Syntax
@@ -14,6 +16,7 @@ from rich.text import Text
 
 from .theme import (
     orbiton_theme,
+    STYLES,
     SYMBOL_USER,
     SYMBOL_AGENT,
     SYMBOL_TOOL_ACTION,
@@ -35,18 +38,81 @@ from .theme import (
     COLLAPSED_PREVIEW_LENGTH,
 )
 
+# Home directory, shown as "~" in the header (resolved once)
+_HOME = str(Path.home())
+
+# Tool line prefixes; tool output is rendered as styled Text, never parsed as markup
+_TOOL_ACTION_PREFIX = f"{SYMBOL_TOOL_ACTION} "
+_TOOL_RESULT_PREFIX = f"{SYMBOL_TOOL_RESULT} "
+
+# Message prefixes, styled once; per-message work is only the timestamp
+_USER_PREFIX = Text.assemble((SYMBOL_USER, STYLES["user"]), " ")
+_AGENT_PREFIX = Text(SYMBOL_AGENT, STYLES["agent"])
+
+# How much of a tool result _detect_code_language looks at
+_LANG_SCAN_CHARS = 4096
+
+# Markdown syntax worth a Markdown render: block markers at the start of a
+# line (headings, lists, quotes, fences, table rows) or inline bold/code/links
+# anywhere. Plain prose with the odd "-" or "*" stays on the cheap plain-text path.
+_MARKDOWN_RE = re.compile(
+    r"^ {0,3}(?:#{1,6}\s|[-*+]\s|\d+[.)]\s|>|```)|^\s*\|.*\||\*\*|__|`|\[[^\]\n]*\]\(",
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _make_markdown(message: str) -> Markdown:
+    """Parse a message as Markdown (cached, so re-renders skip the parse)."""
+    return Markdown(message)
+
+
+class _LazySyntax:
+    """
+    Syntax-highlighted code that is only built when actually rendered.
+
+    Pygments lexing (and Syntax setup) is skipped entirely for tree nodes
+    that are never printed.
+    """
+
+    __slots__ = ("code", "lexer")
+
+    # Resolved once and shared by every highlighted result
+    _theme = None
+
+    def __init__(self, code: str, lexer: str):
+        self.code = code
+        self.lexer = lexer
+
+    def _syntax(self) -> Syntax:
+        if _LazySyntax._theme is None:
+            _LazySyntax._theme = Syntax.get_theme("monokai")
+        return Syntax(self.code, self.lexer, theme=_LazySyntax._theme, line_numbers=False)
+
+    def __rich_console__(self, console, options):
+        yield self._syntax()
+
+    def __rich_measure__(self, console, options):
+        return self._syntax().__rich_measure__(console, options)
+
 
 class Renderer:
     """Handles all UI rendering for the console."""
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, show_timestamps: bool = False):
         """
         Initialize renderer.
 
         Args:
             console: Rich Console instance. If None, creates new one.
+            show_timestamps: Whether agent messages get a timestamp by default
         """
         self.console = console or Console(theme=orbiton_theme)
+        self.show_timestamps = show_timestamps
+
+        # Markdown and syntax highlighting are skipped when output is not a
+        # terminal (pipes, log capture), where the styling would be discarded
+        self._is_tty = self.console.is_terminal
 
     def render_header(self, agent_name: str = "Orbiton Agent", model: str = "", cwd: str = ""):
         """
@@ -57,11 +123,11 @@ class Renderer:
             model: Model name being used
             cwd: Current working directory
         """
-        if not cwd:
-            cwd = os.getcwd()
+        # Callers pass Path.cwd() or a str; both are already normalised
+        cwd = str(cwd) if cwd else os.getcwd()
 
         # Make path more readable (use ~ for home)
-        cwd = str(Path(cwd)).replace(str(Path.home()), "~")
+        cwd = cwd.replace(_HOME, "~", 1)
 
         header_text = f"[header.primary]{agent_name}[/]"
         if model:
@@ -84,13 +150,18 @@ class Renderer:
             message: User's message
             timestamp: Optional timestamp
         """
-        prefix = f"[user]{SYMBOL_USER}[/]"
+        # Build the line from pre-parsed styles; the message itself is user
+        # text, so it is highlighted but never parsed as markup
         if timestamp:
-            ts = timestamp.strftime("%H:%M:%S")
-            prefix = f"[dim]{ts}[/] {prefix}"
+            text = Text.assemble(
+                (timestamp.strftime("%H:%M:%S"), STYLES["timestamp"]), " ", _USER_PREFIX
+            )
+        else:
+            text = _USER_PREFIX.copy()
+        text.append_text(self.console.render_str(message, markup=False))
 
-        self.console.print(f"{prefix} {message}")
-        self.console.print()  # Empty line for spacing
+        # Message and spacing line in a single print
+        self.console.print(Group(text, ""))
 
     def render_agent_message(self, message: str, timestamp: Optional[datetime] = None):
         """
@@ -98,27 +169,60 @@ class Renderer:
 
         Args:
             message: Agent's message
-            timestamp: Optional timestamp
+            timestamp: Optional timestamp (defaults to now if show_timestamps is set)
         """
-        prefix = f"[agent]{SYMBOL_AGENT}[/]"
-        if timestamp:
-            ts = timestamp.strftime("%H:%M:%S")
-            prefix = f"[dim]{ts}[/] {prefix}"
+        if timestamp is None and self.show_timestamps:
+            timestamp = datetime.now()
 
-        self.console.print(prefix)
+        if timestamp:
+            prefix = Text.assemble(
+                (timestamp.strftime("%H:%M:%S"), STYLES["timestamp"]), " ", _AGENT_PREFIX
+            )
+        else:
+            # Only rendered, never mutated, so the shared prefix can be used as is
+            prefix = _AGENT_PREFIX
 
         # Try to render as markdown if it contains markdown syntax
-        if any(marker in message for marker in ["```", "**", "*", "#", "-", ">"]):
+        body = None
+        if self._is_tty and _MARKDOWN_RE.search(message):
             try:
-                md = Markdown(message)
-                self.console.print(md)
+                body = _make_markdown(message)
             except Exception:
                 # Fall back to plain text
-                self.console.print(f"  {message}")
-        else:
-            self.console.print(f"  {message}")
+                body = None
+        if body is None:
+            # Agent text is data: brackets must not be parsed as Rich markup.
+            # Off a terminal the highlighting would be discarded, so skip it.
+            if self._is_tty:
+                body = self.console.render_str(f"  {message}", markup=False)
+            else:
+                body = Text(f"  {message}")
 
-        self.console.print()  # Empty line for spacing
+        # Prefix, body and spacing line in a single print
+        self.console.print(Group(prefix, body, ""))
+
+    def begin_tool_batch(self) -> Tree:
+        """
+        Start a batch of tool calls that is rendered in a single pass.
+
+        Pass the returned tree as ``tree_parent`` to ``render_tool_action``
+        for each call, then hand it to ``end_tool_batch`` once the batch is
+        complete.
+
+        Returns:
+            Tree with a hidden root to collect tool actions under
+        """
+        return Tree(Text(), guide_style=TREE_GUIDE_STYLE, hide_root=True)
+
+    def end_tool_batch(self, tree: Tree):
+        """
+        Render a completed tool batch.
+
+        Args:
+            tree: Tree returned by ``begin_tool_batch``
+        """
+        if tree.children:
+            self.render_tree(tree)
 
     def render_tool_action(
         self,
@@ -139,7 +243,8 @@ class Renderer:
         """
         # Format arguments
         args_str = self._format_tool_args(arguments)
-        action_text = f"[tool.action]{SYMBOL_TOOL_ACTION} {tool_name}({args_str})[/]"
+        # Plain Text: tool names and arguments are data, not markup
+        action_text = Text(f"{_TOOL_ACTION_PREFIX}{tool_name}({args_str})", style="tool.action")
 
         if tree_parent is None:
             # Create new tree
@@ -155,7 +260,7 @@ class Renderer:
         tree_node: Tree,
         expandable: bool = False,
         expanded: bool = False,
-        section_id: Optional[str] = None,
+        section_id: Optional[int] = None,
     ):
         """
         Render tool result with progressive disclosure.
@@ -169,26 +274,31 @@ class Renderer:
         """
         if expandable and not expanded:
             # Show collapsed preview
-            lines = result.split("\n")
-            line_count = len(lines)
-            preview = result[:COLLAPSED_PREVIEW_LENGTH]
+            line_count = result.count("\n") + 1
             if len(result) > COLLAPSED_PREVIEW_LENGTH:
-                preview += "..."
+                preview = result[:COLLAPSED_PREVIEW_LENGTH] + "..."
+            else:
+                preview = result
 
-            result_text = f"[tool.result]{SYMBOL_TOOL_RESULT} {preview}[/]"
-            hint_text = f" [dim](ctrl+o to expand) +{line_count} lines[/]"
-            tree_node.add(result_text + hint_text)
+            tree_node.add(Text.assemble(
+                (_TOOL_RESULT_PREFIX + preview, "tool.result"),
+                " ",
+                (f"(ctrl+o to expand) +{line_count} lines", "dim"),
+            ))
         else:
             # Show full result
             # Try to detect if it's code and apply syntax highlighting
-            lang = self._detect_code_language(result)
-            if lang and len(result.split("\n")) > 1:
-                syntax = Syntax(result, lang, theme="monokai", line_numbers=False)
-                tree_node.add(syntax)
+            # (single-line results are never highlighted, so skip detection)
+            lang = (
+                self._detect_code_language(result)
+                if self._is_tty and "\n" in result else None
+            )
+            if lang:
+                tree_node.add(_LazySyntax(result, lang))
             else:
-                result_text = f"[tool.result]{SYMBOL_TOOL_RESULT} {result}[/]"
+                result_text = Text(_TOOL_RESULT_PREFIX + result, style="tool.result")
                 if expandable:
-                    result_text += " [dim](ctrl+o to collapse)[/]"
+                    result_text = Text.assemble(result_text, " ", ("(ctrl+o to collapse)", "dim"))
                 tree_node.add(result_text)
 
     def render_thinking(
@@ -291,8 +401,7 @@ class Renderer:
         Args:
             tree: Tree to render
         """
-        self.console.print(tree)
-        self.console.print()  # Empty line for spacing
+        self.console.print(Group(tree, ""))  # Trailing empty line for spacing
 
     def clear_screen(self):
         """Clear the console screen."""
@@ -325,16 +434,16 @@ class Renderer:
 
         formatted = []
         for key, value in arguments.items():
-            # Truncate long values
-            value_str = str(value)
-            if len(value_str) > 50:
-                value_str = value_str[:47] + "..."
-
-            # Add quotes for strings
             if isinstance(value, str):
-                value_str = f'"{value_str}"'
-
-            formatted.append(f"{key}={value_str}")
+                # Strings are truncated in place (no str() copy) and quoted
+                if len(value) > 50:
+                    value = value[:47] + "..."
+                formatted.append(f'{key}="{value}"')
+            else:
+                value_str = str(value)
+                if len(value_str) > 50:
+                    value_str = value_str[:47] + "..."
+                formatted.append(f"{key}={value_str}")
 
         return ", ".join(formatted)
 
@@ -348,6 +457,10 @@ class Renderer:
         Returns:
             Language identifier or None
         """
+        # Code markers show up early; only scan the head of large outputs
+        if len(text) > _LANG_SCAN_CHARS:
+            text = text[:_LANG_SCAN_CHARS]
+
         # Simple heuristics for common languages
         if "def " in text and ":" in text:
             return "python"
@@ -372,8 +485,8 @@ class Renderer:
         Returns:
             True if content should be expandable
         """
-        lines = content.split("\n")
-        return len(lines) > AUTO_EXPAND_THRESHOLD
+        # More than AUTO_EXPAND_THRESHOLD lines, counted without splitting
+        return content.count("\n") >= AUTO_EXPAND_THRESHOLD
 
 
 class ExpandableSection:
@@ -381,7 +494,7 @@ class ExpandableSection:
 
     def __init__(
         self,
-        section_id: str,
+        section_id: int,
         content: str,
         section_type: str = "tool_result",
         metadata: Optional[dict] = None,
@@ -390,7 +503,7 @@ class ExpandableSection:
         Initialize expandable section.
 
         Args:
-            section_id: Unique identifier
+            section_id: Unique identifier assigned at registration
             content: Full content
             section_type: Type of section (tool_result, thinking, etc.)
             metadata: Optional metadata
@@ -426,7 +539,9 @@ class SectionManager:
 
     def __init__(self):
         """Initialize section manager."""
-        self.sections: dict[str, ExpandableSection] = {}
+        self.sections: dict[int, ExpandableSection] = {}
+        # Sections in registration order, for O(1) positional access
+        self._order: list[ExpandableSection] = []
         self._id_counter = 0
 
     def register(
@@ -434,7 +549,7 @@ class SectionManager:
         content: str,
         section_type: str = "tool_result",
         metadata: Optional[dict] = None,
-    ) -> str:
+    ) -> int:
         """
         Register a new expandable section.
 
@@ -444,9 +559,9 @@ class SectionManager:
             metadata: Optional metadata
 
         Returns:
-            Section ID
+            Section ID (monotonically increasing integer)
         """
-        section_id = f"{section_type}_{self._id_counter}"
+        section_id = self._id_counter
         self._id_counter += 1
 
         section = ExpandableSection(
@@ -456,14 +571,15 @@ class SectionManager:
             metadata=metadata,
         )
         self.sections[section_id] = section
+        self._order.append(section)
 
         return section_id
 
-    def get(self, section_id: str) -> Optional[ExpandableSection]:
+    def get(self, section_id: int) -> Optional[ExpandableSection]:
         """Get section by ID."""
         return self.sections.get(section_id)
 
-    def toggle(self, section_id: str) -> bool:
+    def toggle(self, section_id: int) -> bool:
         """
         Toggle section expanded state.
 
@@ -479,8 +595,25 @@ class SectionManager:
             return section.expanded
         return False
 
+    def section_count(self) -> int:
+        """Get the number of registered sections."""
+        return len(self._order)
+
+    def get_section_at(self, index: int) -> Optional[ExpandableSection]:
+        """
+        Get a section by registration position.
+
+        Args:
+            index: Position (negative indexes count from the end)
+
+        Returns:
+            Section at that position, or None if out of range
+        """
+        try:
+            return self._order[index]
+        except IndexError:
+            return None
+
     def get_last_section(self) -> Optional[ExpandableSection]:
         """Get the most recently added section."""
-        if not self.sections:
-            return None
-        return list(self.sections.values())[-1]
+        return self._order[-1] if self._order else None
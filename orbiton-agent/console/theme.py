@@ -1,5 +1,6 @@
 """Theme and styling for Orbiton Agent console interface."""
 
+from rich.style import Style
 from rich.theme import Theme
 from rich import box
 
@@ -18,7 +19,7 @@ HEADER_SECONDARY = "dim white"
 INFO_COLOR = "blue"
 
 # Custom Rich Theme
-orbiton_theme = Theme({
+_THEME_STYLES = {
     "user": USER_COLOR,
     "agent": AGENT_COLOR,
     "tool.action": TOOL_ACTION_COLOR,
@@ -36,7 +37,11 @@ orbiton_theme = Theme({
     "command": "bold magenta",
     "timestamp": "dim",
     "highlight": "bold yellow",
-})
+}
+orbiton_theme = Theme(_THEME_STYLES)
+
+# Parsed Style objects per theme name, for building Text without markup
+STYLES = {name: Style.parse(definition) for name, definition in _THEME_STYLES.items()}
 
 # Box Styles for Panels
 HEADER_BOX = box.HEAVY
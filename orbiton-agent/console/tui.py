@@ -1,6 +1,7 @@
 """Full-screen TUI layout using prompt_toolkit."""
 
 import asyncio
+import functools
 from datetime import datetime
 from typing import Optional, List, Callable
 from pathlib import Path
@@ -35,6 +36,10 @@ from .theme import (
     SYMBOL_THINKING,
 )
 
+# While the TUI is running, history updates arriving within this window
+# (seconds) are coalesced into a single buffer rebuild and redraw
+_HISTORY_REFRESH_INTERVAL = 0.016
+
 
 class TUIApp:
     """Full-screen Terminal User Interface Application."""
@@ -51,7 +56,9 @@ class TUIApp:
         Args:
             agent_name: Name of the agent
             model: Model name
-            on_input: Callback function when user submits input
+            on_input: Callback function when user submits input. Plain
+                functions run in a worker thread; coroutine functions are
+                awaited on the UI event loop.
         """
         self.agent_name = agent_name
         self.model = model
@@ -65,6 +72,9 @@ class TUIApp:
         self.status_text = ""
         self.show_status = False
 
+        # Whether a coalesced history refresh is already scheduled
+        self._history_refresh_pending = False
+
         # Create buffers and controls
         self._create_layout()
         self._create_key_bindings()
@@ -230,7 +240,10 @@ class TUIApp:
         """
         if self.on_input:
             try:
-                await asyncio.to_thread(self.on_input, text)
+                if asyncio.iscoroutinefunction(self.on_input):
+                    await self.on_input(text)
+                else:
+                    await asyncio.to_thread(self.on_input, text)
             except Exception as e:
                 self.add_error_message(f"Error: {str(e)}")
 
@@ -458,6 +471,34 @@ class TUIApp:
         self.history_messages.append(msg)
         self._scroll_to_bottom()
 
+    def call_from_thread(self, func: Callable, *args, **kwargs):
+        """
+        Run a UI update on the TUI event loop.
+
+        Safe to call from worker threads (agent execution, callbacks). When
+        the TUI is not running, or we are already on its loop, func is
+        called directly.
+
+        Args:
+            func: Callable to run, typically one of the add_*/set_* methods
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        loop = self.app.loop
+        if loop is None or not loop.is_running():
+            func(*args, **kwargs)
+            return
+
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+
+        if current is loop:
+            func(*args, **kwargs)
+        else:
+            loop.call_soon_threadsafe(functools.partial(func, *args, **kwargs))
+
     def set_status(self, text: str, style: str = "status"):
         """
         Set status line text.
@@ -484,6 +525,24 @@ class TUIApp:
 
     def _scroll_to_bottom(self):
         """Scroll history to bottom."""
+        loop = self.app.loop
+        if loop is None or not loop.is_running():
+            # Not running: update buffer with new messages right away
+            self._update_history_buffer()
+            self.app.invalidate()
+            return
+
+        # Running: coalesce bursts of messages into one rebuild per interval
+        # (call_soon_threadsafe, since messages may come from worker threads)
+        if not self._history_refresh_pending:
+            self._history_refresh_pending = True
+            loop.call_soon_threadsafe(
+                loop.call_later, _HISTORY_REFRESH_INTERVAL, self._flush_history
+            )
+
+    def _flush_history(self):
+        """Apply a coalesced history refresh (runs on the TUI event loop)."""
+        self._history_refresh_pending = False
         # Update buffer with new messages
         self._update_history_buffer()
         # Invalidate to redraw
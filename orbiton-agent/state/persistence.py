@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict
@@ -282,7 +283,8 @@ class AutoSaver:
     """
     Handles automatic session saving.
 
-    This runs in the background and periodically saves the session.
+    This runs in the background and saves the session after it changes
+    (see mark_dirty), at most once per interval. It sleeps while idle.
     """
 
     def __init__(self, session_manager, persistence: SessionPersistence, interval: int = 60):
@@ -292,44 +294,54 @@ class AutoSaver:
         Args:
             session_manager: SessionManager instance
             persistence: SessionPersistence instance
-            interval: Save interval in seconds
+            interval: Minimum seconds between saves
         """
         self.session_manager = session_manager
         self.persistence = persistence
         self.interval = interval
         self.running = False
         self._thread = None
+        self._dirty = threading.Event()
+        self._stop_event = threading.Event()
+
+    def mark_dirty(self):
+        """Note that the session changed and should be saved."""
+        self._dirty.set()
 
     def start(self):
         """Start auto-save in background."""
-        import threading
-
         if self.running:
             return
 
         self.running = True
+        # Fresh events per run: stop() sets both to wake the previous thread
+        stop_event = self._stop_event = threading.Event()
+        dirty = self._dirty = threading.Event()
 
         def _auto_save_loop():
-            import time
-
-            while self.running:
-                time.sleep(self.interval)
-                if self.running:
-                    try:
-                        session_state = self.session_manager.get_session_state()
-                        self.persistence.auto_save(session_state)
-                    except Exception:
-                        # Silent fail - don't interrupt main app
-                        pass
+            while not stop_event.is_set():
+                # Sleep until the session changes (or stop() wakes us)
+                dirty.wait()
+                # Let further changes accumulate for one interval
+                if stop_event.wait(self.interval):
+                    break
+                dirty.clear()
+                try:
+                    session_state = self.session_manager.get_session_state()
+                    self.persistence.auto_save(session_state)
+                except Exception:
+                    # Silent fail - don't interrupt main app
+                    pass
 
         self._thread = threading.Thread(target=_auto_save_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
         """Stop auto-save and perform final save (non-blocking)."""
-        import threading
-
         self.running = False
+        self._stop_event.set()
+        # Wake the loop if it is waiting for changes
+        self._dirty.set()
 
         # Perform final save in background to avoid blocking UI shutdown
         def _final_save():
@@ -37,20 +37,20 @@ def test_event_loop_reuse():
     session = AgentSession(mock_agent, config)
 
     # Get the event loop reference
-    loop1 = session._event_loop
+    loop1 = session._runner.get_loop()
     print(f'✓ AgentSession created with event loop: {id(loop1)}')
 
     # Execute first message
     print('\n[Test 1] First execution...')
     response1 = session.execute('Hello')
-    loop2 = session._event_loop
+    loop2 = session._runner.get_loop()
     print(f'  Event loop after execution: {id(loop2)}')
     print(f'  Response: {response1}')
 
     # Execute second message
     print('\n[Test 2] Second execution...')
     response2 = session.execute('World')
-    loop3 = session._event_loop
+    loop3 = session._runner.get_loop()
     print(f'  Event loop after execution: {id(loop3)}')
     print(f'  Response: {response2}')
 
@@ -5,6 +5,7 @@ import sys
 import json
 import asyncio
 import logging
+import os
 from pathlib import Path
 
 # Add parent directory to path
@@ -157,6 +158,50 @@ async def test_simple_query():
         logger.exception("Query execution failed")
 
 
+async def test_mcp_env_substitution():
+    """Test ${VAR} / ${VAR:-default} substitution in MCP server env."""
+    print("\n" + "="*80)
+    print("TEST 5: MCP Environment Substitution")
+    print("="*80)
+
+    os.environ["ORBITON_TEST_SET"] = "from-env"
+    os.environ.pop("ORBITON_TEST_UNSET", None)
+
+    mcp_config = {
+        "enabled": True,
+        "servers": [{
+            "name": "env_test",
+            "config": {
+                "command": "python",
+                "args": [],
+                "env": {
+                    "SET_VAR": "${ORBITON_TEST_SET}",
+                    "DEFAULTED_VAR": "${ORBITON_TEST_UNSET:-fallback}",
+                    "MISSING_VAR": "${ORBITON_TEST_UNSET}",
+                    "NODE_ENV": "development",
+                },
+            },
+        }],
+    }
+
+    try:
+        mcp_tools = AgentFactory._create_mcp_tools(mcp_config)
+        assert len(mcp_tools) == 1
+        env = mcp_tools[0].mcp_config["env"]
+
+        assert env["SET_VAR"] == "from-env"
+        print("✓ Set variable is substituted")
+        assert env["DEFAULTED_VAR"] == "fallback"
+        print("✓ Unset variable falls back to its default")
+        assert "MISSING_VAR" not in env
+        print("✓ Unset variable without default is dropped")
+        assert env["NODE_ENV"] == "development"
+        assert env["PYTHONWARNINGS"] == "ignore"
+        print("✓ Server env overrides the quiet-output defaults")
+    finally:
+        os.environ.pop("ORBITON_TEST_SET", None)
+
+
 async def main():
     """Run all tests."""
     print("\n" + "="*80)
@@ -173,6 +218,9 @@ async def main():
     # Note: This will only work if MCP servers are running
     await test_mcp_tool_parameters()
 
+    # Test 5: ${VAR} substitution in MCP server env (no servers needed)
+    await test_mcp_env_substitution()
+
     # Test 4: Simple query
     # Uncomment to test a full agent query (requires MCP servers)
     # await test_simple_query()
@@ -212,6 +212,62 @@ except Exception as e:
     print(f"  ❌ Keyboard bindings test failed: {e}")
     sys.exit(1)
 
+# Test 11: Auto-saver
+print("\n✓ Test 11: Auto-Saver - Save on Change...")
+try:
+    import threading
+    import time
+
+    class CountingPersistence:
+        """Stub persistence that counts auto-saves."""
+
+        def __init__(self):
+            self.saves = 0
+            self.saved = threading.Event()
+
+        def auto_save(self, session_state):
+            self.saves += 1
+            self.saved.set()
+
+    counting = CountingPersistence()
+    saver = AutoSaver(session_manager=session_mgr, persistence=counting, interval=0.05)
+    saver.start()
+
+    # No save while the session is unchanged
+    time.sleep(0.2)
+    assert counting.saves == 0
+
+    # A burst of changes is saved once
+    for _ in range(5):
+        saver.mark_dirty()
+    assert counting.saved.wait(1)
+    time.sleep(0.2)
+    assert counting.saves == 1
+
+    # stop() wakes the idle thread (and does a final save)
+    counting.saved.clear()
+    thread = saver._thread
+    saver.stop()
+    thread.join(1)
+    assert not thread.is_alive()
+    assert counting.saved.wait(1)
+    assert counting.saves == 2
+
+    # start() after stop() works without saving the unchanged session
+    counting.saved.clear()
+    saver.start()
+    time.sleep(0.2)
+    assert counting.saves == 2
+    saver.mark_dirty()
+    assert counting.saved.wait(1)
+    assert counting.saves == 3
+    saver.stop()
+
+    print(f"  ✅ Auto-saver saves once per change burst and restarts cleanly")
+except Exception as e:
+    print(f"  ❌ Auto-saver test failed: {e}")
+    sys.exit(1)
+
 # Cleanup
 print("\n✓ Cleanup...")
 try: